@@ -29,7 +29,7 @@ def compare_credentials():
     print(f"{'Field':<20} {'Blades':<30} {'MrTarget':<30}")
     print("-" * 80)
     
-    all_keys = set(blades_creds.keys()) | set(mrtarget_creds.keys())
+    all_keys = blades_creds.keys() | mrtarget_creds.keys()
     
     for key in sorted(all_keys):
         blades_has = "✓" if key in blades_creds else "✗ MISSING"
@@ -164,7 +164,7 @@ def compare_configs(client1, client2):
     
     # Check for key differences
     print("\nCredential fields comparison:")
-    all_keys = set(creds1.keys()) | set(creds2.keys())
+    all_keys = creds1.keys() | creds2.keys()
     
     for key in sorted(all_keys):
         in_1 = key in creds1
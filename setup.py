@@ -18,6 +18,9 @@ setup(
     author_email='your.email@example.com',
     url='https://github.com/yourusername/zoho-field-analyzer',
     packages=find_packages(),
+    package_data={
+        'src.analyzers': ['_report_template.html'],
+    },
     python_requires='>=3.8',
     install_requires=[
         'requests>=2.31.0',
@@ -30,6 +33,10 @@ setup(
         'pandas>=2.0.0',
     ],
     extras_require={
+        'speedups': [
+            'orjson>=3.9',
+            'ijson>=3.1',
+        ],
         'dev': [
             'pytest>=7.0',
             'pytest-cov>=4.0',
@@ -70,17 +70,20 @@ class BlueprintAnalyzer:
                 bp_id = str(metadata.get('Id', ''))
                 bp_name = metadata.get('Name', '')
                 
-                if not bp_id or not bp_name:
-                    # Fallback: try Processes array format
-                    processes = bp_data.get('Processes', [])
-                    for p in (processes if isinstance(processes, list) else [processes]):
-                        pid = str(p.get('Id', ''))
-                        pname = p.get('Name', '')
-                        if pid:
-                            blueprint_names[pid] = pname or bp_file.stem
-                else:
+                if bp_id and bp_name:
                     blueprint_names[bp_id] = bp_name
-                    
+                    continue
+
+                # Fallback: try Processes array format
+                processes = bp_data.get('Processes', [])
+                if not isinstance(processes, list):
+                    processes = [processes]
+                for p in processes:
+                    pid = str(p.get('Id', ''))
+                    pname = p.get('Name', '')
+                    if pid:
+                        blueprint_names[pid] = pname or bp_file.stem
+
                 # Also try extracting from filename: Name_ID.json
                 if not bp_id:
                     parts = bp_file.stem.rsplit('_', 1)
@@ -162,9 +165,9 @@ class BlueprintAnalyzer:
                 if fid:
                     resolved = self.rosetta.resolve_by_id(fid)
                 if not resolved and col_name:
-                    resolved = self.rosetta.resolve(module, column_name=col_name)
+                    resolved = self.rosetta.resolve_column_name(module, col_name)
                 if not resolved and label:
-                    resolved = self.rosetta.resolve(module, field_label=label)
+                    resolved = self.rosetta.resolve_label(module, label)
                 
                 if resolved:
                     field_map[fid] = resolved.api_name
@@ -207,7 +210,7 @@ class BlueprintAnalyzer:
                     self._log_unresolved(module, f"ID:{fid}", fid, source_label, "during_field")
             else:
                 # Get the label from Rosetta for display
-                resolved = self.rosetta.resolve(module, api_name=api_name)
+                resolved = self.rosetta.resolve_api_name(module, api_name)
                 if resolved:
                     label = resolved.field_label
             
@@ -243,7 +246,7 @@ class BlueprintAnalyzer:
             
             api_name = field_map.get(fid)
             if not api_name:
-                resolved = self.rosetta.resolve(module, field_label=label)
+                resolved = self.rosetta.resolve_label(module, label)
                 if resolved:
                     api_name = resolved.api_name
                 else:
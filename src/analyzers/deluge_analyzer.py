@@ -10,9 +10,14 @@ Strategy:
   4. .put("field", val) on update map variables → WRITE
   5. Heuristics to exclude non-field maps (error logging, API params, etc.)
 """
+import os
 import re
 import logging
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
 from pathlib import Path
+from sys import intern
 from typing import Dict, List, Set, Tuple, Optional
 
 from .rosetta import RosettaStone
@@ -20,33 +25,35 @@ from .usage import FieldUsage, UsageType, SourceType, UsageTracker
 
 logger = logging.getLogger(__name__)
 
-# Patterns to match Deluge code
+# Patterns to match Deluge code. Compiled as bytes: scripts are scanned
+# undecoded and only the captured names are decoded (\w is ASCII-only).
 RE_GET_RECORD = re.compile(
-    r'(\w+)\s*=\s*zoho\.crm\.getRecordById\(\s*"(\w+)"', re.IGNORECASE
+    rb'(\w+)\s*=\s*zoho\.crm\.getRecordById\(\s*"(\w+)"', re.IGNORECASE
 )
 RE_SEARCH_RECORDS = re.compile(
-    r'(\w+)\s*=\s*zoho\.crm\.searchRecords\(\s*"(\w+)"', re.IGNORECASE
+    rb'(\w+)\s*=\s*zoho\.crm\.searchRecords\(\s*"(\w+)"', re.IGNORECASE
 )
 RE_GET_RELATED = re.compile(
-    r'(\w+)\s*=\s*zoho\.crm\.getRelatedRecords\(\s*"(\w+)"', re.IGNORECASE
+    rb'(\w+)\s*=\s*zoho\.crm\.getRelatedRecords\(\s*"(\w+)"', re.IGNORECASE
 )
 RE_UPDATE_RECORD = re.compile(
-    r'zoho\.crm\.updateRecord\(\s*"(\w+)"\s*,\s*(\w+)\s*,\s*(\w+)', re.IGNORECASE
+    rb'zoho\.crm\.updateRecord\(\s*"(\w+)"\s*,\s*(\w+)\s*,\s*(\w+)', re.IGNORECASE
 )
 RE_CREATE_RECORD = re.compile(
-    r'zoho\.crm\.createRecord\(\s*"(\w+)"\s*,\s*(\w+)', re.IGNORECASE
+    rb'zoho\.crm\.createRecord\(\s*"(\w+)"\s*,\s*(\w+)', re.IGNORECASE
 )
 RE_MAP_INIT = re.compile(
-    r'(\w+)\s*=\s*(?:Map\(\)|map\(\)|{})', re.IGNORECASE
+    rb'(\w+)\s*=\s*(?:Map\(\)|map\(\)|{})', re.IGNORECASE
 )
-RE_DOT_GET = re.compile(
-    r'(\w+)\.get\(\s*"(\w+)"\s*\)'
+# .get("field") / .put("field", ...) in a single pass over the script
+RE_DOT_ACCESS = re.compile(
+    rb'(?P<var>\w+)\.(?:get\(\s*"(?P<get>\w+)"\s*\)|put\(\s*"(?P<put>\w+)"\s*,)'
 )
-RE_DOT_PUT = re.compile(
-    r'(\w+)\.put\(\s*"(\w+)"\s*,'
+RE_FOR_EACH = re.compile(
+    rb'for\s+each\s+(\w+)\s+in\s+(\w+)'
 )
 RE_FUNCTION_HEADER = re.compile(
-    r'(?:void|string|int|bool|list|map)\s+[\w.]+\(([^)]*)\)', re.IGNORECASE
+    rb'(?:void|string|int|bool|list|map)\s+[\w.]+\(([^)]*)\)', re.IGNORECASE
 )
 
 # Variable names that are clearly NOT field maps
@@ -55,6 +62,7 @@ NOISE_VAR_NAMES = {
     'headers', 'params', 'queryParams', 'body', 'response',
     'resp', 'result', 'config', 'settings', 'options',
 }
+NOISE_VAR_NAMES_LOWER = frozenset(v.lower() for v in NOISE_VAR_NAMES)
 
 # Field names that are clearly NOT CRM fields
 NOISE_FIELD_NAMES = {
@@ -72,6 +80,17 @@ UPDATE_MAP_PATTERNS = re.compile(
     re.IGNORECASE
 )
 
+# Zoho internal module names → API module names
+MODULE_ALIASES = {
+    'Potentials': 'Deals',
+    'Sales_Orders': 'Sales_Orders',
+    'Salesorders': 'Sales_Orders',
+    'Purchase_Orders': 'Purchase_Orders',
+}
+
+# Below this many scripts, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 64
+
 
 class DelugeAnalyzer:
     """Analyze Deluge function scripts for field reads/writes."""
@@ -87,220 +106,279 @@ class DelugeAnalyzer:
             'unresolved_writes': 0,
         }
     
-    def analyze_all(self, functions_dir: Path):
-        """Analyze all Deluge function scripts."""
-        for func_file in sorted(functions_dir.glob("*.txt")):
-            try:
-                with open(func_file, encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                func_name = self._extract_function_name(content, func_file)
-                self._analyze_function(content, func_name, func_file.stem)
-                self.stats['functions_processed'] += 1
-                
-            except Exception as e:
-                logger.error(f"Error processing {func_file.name}: {e}")
+    def analyze_all(self, functions_dir: Path, max_workers: Optional[int] = None):
+        """
+        Analyze all Deluge function scripts.
+        
+        Scripts are read and scanned in worker processes once there are
+        enough of them to pay for the pool; resolution against the Rosetta
+        Stone and tracker updates always happen here, in file order.
+        
+        Args:
+            functions_dir: Directory of extracted *.txt function scripts
+            max_workers: Worker process count (default: CPU count).
+                         1 forces a serial scan.
+        """
+        if not functions_dir.is_dir():
+            logger.warning(f"No functions directory at {functions_dir}")
+            return
+        
+        # scandir hands back plain path strings (cheap to pickle to workers)
+        with os.scandir(functions_dir) as it:
+            entries = sorted((e.name, e.path) for e in it
+                             if e.name.endswith('.txt') and e.is_file())
+        paths = [path for _, path in entries]
+        
+        if max_workers == 1 or len(paths) < PARALLEL_MIN_FILES:
+            results = map(_scan_function, paths)
+            self._record_results(results)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(_scan_function, paths, chunksize=16)
+                self._record_results(results)
         
         logger.info(f"Deluge analysis complete: "
                      f"{self.stats['functions_processed']} functions, "
                      f"{self.stats['field_reads']} reads, "
                      f"{self.stats['field_writes']} writes")
     
-    def _extract_function_name(self, content: str, filepath: Path) -> str:
-        """Extract display name from the file header."""
-        for line in content.split('\n')[:5]:
-            if line.startswith('// Display_Name:') or line.startswith('// Function:'):
-                return line.split(':', 1)[1].strip()
-        return filepath.stem
+    def _record_results(self, results):
+        """Feed scan results into the tracker."""
+        for file_name, source_id, func_name, hits, error in results:
+            if error:
+                logger.error(f"Error processing {file_name}: {error}")
+                continue
+            self._record_hits(hits, func_name, source_id)
+            self.stats['functions_processed'] += 1
     
     def _analyze_function(self, content: str, func_name: str, source_id: str):
+        """Analyze a single Deluge function for field reads and writes."""
+        self._record_hits(_scan_content(content.encode('utf-8')), func_name, source_id)
+    
+    def _record_hits(self, hits: List[tuple], func_name: str, source_id: str):
         """
-        Analyze a single Deluge function for field reads and writes.
-        
-        Uses variable flow tracking:
-        1. Identify record variables (from getRecordById, etc.)
-        2. Identify update maps (from Map() that feed into updateRecord)
-        3. Track .get() on records → READ
-        4. Track .put() on update maps → WRITE
-        """
-        lines = content.split('\n')
+        Validate scan hits against the Rosetta Stone and record usages.
         
-        # Phase 1: Identify record variables and their modules
-        record_vars = self._find_record_variables(content)
+        Fields not in the Rosetta Stone could be valid but custom, so
+        they are still tracked but marked as unresolved.
         
-        # Phase 2: Identify update maps and their target modules
-        update_maps = self._find_update_maps(content)
+        Module and field names arrive as fresh strings from the scan
+        (unpickled per script when scanning in workers), so they are
+        interned to share one copy across every usage in the tracker.
+        """
+        # Same for every hit in the script - build once
+        source_name = f"Function: {func_name}"
+        usages = []
         
-        # Phase 3: Scan all .get() calls on record variables → READs
-        for match in RE_DOT_GET.finditer(content):
-            var_name = match.group(1)
-            field_name = match.group(2)
-            
-            if field_name in NOISE_FIELD_NAMES:
-                continue
+        for is_read, module, field_name, line_num, context in hits:
+            module = intern(module)
+            field_name = intern(field_name)
+            resolved = self.rosetta.resolve_api_name(module, field_name)
             
-            if var_name in record_vars:
-                module = record_vars[var_name]
-                line_num = content[:match.start()].count('\n') + 1
-                
-                # Validate field exists in module
-                resolved = self.rosetta.resolve(module, api_name=field_name)
-                if resolved:
-                    self.tracker.add_usage(FieldUsage(
-                        usage_type=UsageType.READ,
-                        source_type=SourceType.FUNCTION,
-                        source_name=f"Function: {func_name}",
-                        source_id=source_id,
-                        module=module,
-                        field_api_name=field_name,
-                        details={'line': line_num}
-                    ))
-                    self.stats['field_reads'] += 1
-                else:
-                    # Field not in Rosetta Stone - could be valid but custom
-                    # Still track it but mark as unresolved
-                    self.tracker.add_usage(FieldUsage(
-                        usage_type=UsageType.READ,
-                        source_type=SourceType.FUNCTION,
-                        source_name=f"Function: {func_name}",
-                        source_id=source_id,
-                        module=module,
-                        field_api_name=field_name,
-                        details={'line': line_num, 'unresolved': True}
-                    ))
-                    self.stats['unresolved_reads'] += 1
-        
-        # Phase 4: Scan all .put() calls on update maps → WRITEs
-        for match in RE_DOT_PUT.finditer(content):
-            var_name = match.group(1)
-            field_name = match.group(2)
+            if is_read:
+                details = {'line': line_num}
+            else:
+                details = {'line': line_num, 'context': context}
+            if not resolved:
+                details['unresolved'] = True
             
-            if field_name in NOISE_FIELD_NAMES:
-                continue
-            if var_name.lower() in {v.lower() for v in NOISE_VAR_NAMES}:
-                continue
+            usages.append(FieldUsage(
+                usage_type=UsageType.READ if is_read else UsageType.WRITE,
+                source_type=SourceType.FUNCTION,
+                source_name=source_name,
+                source_id=source_id,
+                module=module,
+                field_api_name=field_name,
+                details=details
+            ))
             
-            if var_name in update_maps:
-                module = update_maps[var_name]
-                line_num = content[:match.start()].count('\n') + 1
-                
-                # Try to extract the value being set
-                line_text = lines[line_num - 1] if line_num <= len(lines) else ''
-                
-                resolved = self.rosetta.resolve(module, api_name=field_name)
-                if resolved:
-                    self.tracker.add_usage(FieldUsage(
-                        usage_type=UsageType.WRITE,
-                        source_type=SourceType.FUNCTION,
-                        source_name=f"Function: {func_name}",
-                        source_id=source_id,
-                        module=module,
-                        field_api_name=field_name,
-                        details={
-                            'line': line_num,
-                            'context': line_text.strip()[:200],
-                        }
-                    ))
-                    self.stats['field_writes'] += 1
-                else:
-                    self.tracker.add_usage(FieldUsage(
-                        usage_type=UsageType.WRITE,
-                        source_type=SourceType.FUNCTION,
-                        source_name=f"Function: {func_name}",
-                        source_id=source_id,
-                        module=module,
-                        field_api_name=field_name,
-                        details={
-                            'line': line_num,
-                            'context': line_text.strip()[:200],
-                            'unresolved': True,
-                        }
-                    ))
-                    self.stats['unresolved_writes'] += 1
-    
-    def _find_record_variables(self, content: str) -> Dict[str, str]:
-        """
-        Find variables that hold CRM records.
-        
-        Returns: {variable_name: module_name}
-        """
-        records = {}
-        
-        # zoho.crm.getRecordById("Module", id)
-        for match in RE_GET_RECORD.finditer(content):
-            var_name = match.group(1)
-            module = self._normalize_module(match.group(2))
-            records[var_name] = module
-        
-        # zoho.crm.searchRecords("Module", criteria)
-        # These return lists, but individual items are often accessed
-        for match in RE_SEARCH_RECORDS.finditer(content):
-            var_name = match.group(1)
-            module = self._normalize_module(match.group(2))
-            records[var_name] = module
-            # Common pattern: each = listVar.get(i) or for each in listVar
-            # We'll catch .get() on these too
+            if is_read:
+                self.stats['field_reads' if resolved else 'unresolved_reads'] += 1
+            else:
+                self.stats['field_writes' if resolved else 'unresolved_writes'] += 1
         
-        # Also catch common assignment patterns:
-        # ContactInfo = zoho.crm.getRecordById(...)
-        # Often followed by: ContactEmail = ContactInfo.get("Email")
-        # The variable after = is tracked, not the intermediate
-        
-        # Handle list iteration: for each row in searchResults
-        for_pattern = re.compile(r'for\s+each\s+(\w+)\s+in\s+(\w+)')
-        for match in for_pattern.finditer(content):
-            iter_var = match.group(1)
-            list_var = match.group(2)
-            if list_var in records:
-                records[iter_var] = records[list_var]
-        
-        return records
+        self.tracker.add_usages(usages)
+
+
+# ============================================================
+# Script scanning
+# ============================================================
+# Pure functions of the script text so they can run in worker
+# processes; nothing here touches the Rosetta Stone or tracker.
+
+def _scan_function(path: str) -> tuple:
+    """
+    Read and scan one function script.
     
-    def _find_update_maps(self, content: str) -> Dict[str, str]:
-        """
-        Find Map variables used to update/create CRM records.
-        
-        Strategy:
-        1. Find all zoho.crm.updateRecord("Module", id, mapVar) calls
-        2. Find all zoho.crm.createRecord("Module", mapVar) calls
-        3. Map the mapVar back to its module
-        """
-        update_maps = {}
-        
-        # updateRecord("Module", id, mapVar, ...)
-        for match in RE_UPDATE_RECORD.finditer(content):
-            module = self._normalize_module(match.group(1))
-            map_var = match.group(3)
-            update_maps[map_var] = module
+    Returns:
+        (file_name, source_id, func_name, hits, error) - error is None on
+        success, otherwise a message and the other fields are empty
+    """
+    filepath = Path(path)
+    try:
+        content = filepath.read_bytes()
+        func_name = _extract_function_name(content, filepath)
+        return filepath.name, filepath.stem, func_name, _scan_content(content), None
+    except Exception as e:
+        return filepath.name, filepath.stem, '', [], str(e)
+
+
+def _extract_function_name(content: bytes, filepath: Path) -> str:
+    """Extract display name from the file header."""
+    for line in content.split(b'\n', 5)[:5]:
+        if line.startswith(b'// Display_Name:') or line.startswith(b'// Function:'):
+            return line.split(b':', 1)[1].decode('utf-8', 'ignore').strip()
+    return filepath.stem
+
+
+def _scan_content(content: bytes) -> List[tuple]:
+    """
+    Find candidate field reads and writes in a Deluge script.
+    
+    Uses variable flow tracking:
+    1. Identify record variables (from getRecordById, etc.)
+    2. Identify update maps (from Map() that feed into updateRecord)
+    3. Track .get() on records → READ
+    4. Track .put() on update maps → WRITE
+    (3 and 4 share a single regex pass over the script)
+    
+    Returns:
+        List of (is_read, module, field_name, line_num, context) in
+        script order; context is the source line for writes, else None
+    """
+    hits = []
+    
+    # Every READ/WRITE needs a literal .get( or .put( call - skip the
+    # regex passes entirely for scripts that contain neither
+    if b'.get(' not in content and b'.put(' not in content:
+        return hits
+    
+    # Phase 1: Identify record variables and their modules
+    record_vars = _find_record_variables(content)
+    
+    # Phase 2: Identify update maps and their target modules
+    update_maps = _find_update_maps(content)
+    
+    # No record or update map variables means nothing to attribute
+    if not record_vars and not update_maps:
+        return hits
+    
+    lines = content.split(b'\n')
+    # Offset of the first character of each line after the first, so
+    # a match's line number is a binary search instead of a rescan
+    line_starts = list(accumulate(len(line) + 1 for line in lines))
+    
+    # Phase 3: Scan .get() on record variables → READs and
+    # .put() on update maps → WRITEs in one pass
+    for match in RE_DOT_ACCESS.finditer(content):
+        var_name = match.group('var').decode('ascii')
+        field_name = match.group('get')
+        is_read = field_name is not None
+        if not is_read:
+            field_name = match.group('put')
+        field_name = field_name.decode('ascii')
         
-        # createRecord("Module", mapVar)
-        for match in RE_CREATE_RECORD.finditer(content):
-            module = self._normalize_module(match.group(1))
-            map_var = match.group(2)
-            update_maps[map_var] = module
+        if field_name in NOISE_FIELD_NAMES:
+            continue
         
-        # Also catch pattern where map is built then passed inline:
-        # zoho.crm.updateRecord("Deals", id, {"Stage": "Closed Won"})
-        # These are rare in practice - skip for now
+        if is_read:
+            if var_name in record_vars:
+                line_num = bisect_right(line_starts, match.start()) + 1
+                hits.append((True, record_vars[var_name], field_name, line_num, None))
+            continue
         
-        # If no explicit updateRecord found, use heuristics on Map() variables
-        if not update_maps:
-            for match in RE_MAP_INIT.finditer(content):
-                var_name = match.group(1)
-                if var_name.lower() not in {v.lower() for v in NOISE_VAR_NAMES}:
-                    if UPDATE_MAP_PATTERNS.match(var_name):
-                        # Can't determine module without updateRecord call
-                        # Skip these - better to miss than to misattribute
-                        pass
+        if var_name.lower() in NOISE_VAR_NAMES_LOWER:
+            continue
         
-        return update_maps
+        if var_name in update_maps:
+            line_num = bisect_right(line_starts, match.start()) + 1
+            
+            # Try to extract the value being set
+            line_text = lines[line_num - 1] if line_num <= len(lines) else b''
+            hits.append((False, update_maps[var_name], field_name, line_num,
+                         line_text.decode('utf-8', 'ignore').strip()[:200]))
     
-    def _normalize_module(self, module: str) -> str:
-        """Normalize Zoho module names."""
-        aliases = {
-            'Potentials': 'Deals',
-            'Sales_Orders': 'Sales_Orders',
-            'Salesorders': 'Sales_Orders',
-            'Purchase_Orders': 'Purchase_Orders',
-        }
-        return aliases.get(module, module)
+    return hits
+
+
+def _find_record_variables(content: bytes) -> Dict[str, str]:
+    """
+    Find variables that hold CRM records.
+    
+    Returns: {variable_name: module_name}
+    """
+    records = {}
+    
+    # zoho.crm.getRecordById("Module", id)
+    for match in RE_GET_RECORD.finditer(content):
+        var_name = match.group(1).decode('ascii')
+        module = _normalize_module(match.group(2).decode('ascii'))
+        records[var_name] = module
+    
+    # zoho.crm.searchRecords("Module", criteria)
+    # These return lists, but individual items are often accessed
+    for match in RE_SEARCH_RECORDS.finditer(content):
+        var_name = match.group(1).decode('ascii')
+        module = _normalize_module(match.group(2).decode('ascii'))
+        records[var_name] = module
+        # Common pattern: each = listVar.get(i) or for each in listVar
+        # We'll catch .get() on these too
+    
+    # Also catch common assignment patterns:
+    # ContactInfo = zoho.crm.getRecordById(...)
+    # Often followed by: ContactEmail = ContactInfo.get("Email")
+    # The variable after = is tracked, not the intermediate
+    
+    # Handle list iteration: for each row in searchResults
+    for match in RE_FOR_EACH.finditer(content):
+        iter_var = match.group(1).decode('ascii')
+        list_var = match.group(2).decode('ascii')
+        if list_var in records:
+            records[iter_var] = records[list_var]
+    
+    return records
+
+
+def _find_update_maps(content: bytes) -> Dict[str, str]:
+    """
+    Find Map variables used to update/create CRM records.
+    
+    Strategy:
+    1. Find all zoho.crm.updateRecord("Module", id, mapVar) calls
+    2. Find all zoho.crm.createRecord("Module", mapVar) calls
+    3. Map the mapVar back to its module
+    """
+    update_maps = {}
+    
+    # updateRecord("Module", id, mapVar, ...)
+    for match in RE_UPDATE_RECORD.finditer(content):
+        module = _normalize_module(match.group(1).decode('ascii'))
+        map_var = match.group(3).decode('ascii')
+        update_maps[map_var] = module
+    
+    # createRecord("Module", mapVar)
+    for match in RE_CREATE_RECORD.finditer(content):
+        module = _normalize_module(match.group(1).decode('ascii'))
+        map_var = match.group(2).decode('ascii')
+        update_maps[map_var] = module
+    
+    # Also catch pattern where map is built then passed inline:
+    # zoho.crm.updateRecord("Deals", id, {"Stage": "Closed Won"})
+    # These are rare in practice - skip for now
+    
+    # If no explicit updateRecord found, use heuristics on Map() variables
+    if not update_maps:
+        for match in RE_MAP_INIT.finditer(content):
+            var_name = match.group(1).decode('ascii')
+            if var_name.lower() not in NOISE_VAR_NAMES_LOWER:
+                if UPDATE_MAP_PATTERNS.match(var_name):
+                    # Can't determine module without updateRecord call
+                    # Skip these - better to miss than to misattribute
+                    pass
+    
+    return update_maps
+
+
+def _normalize_module(module: str) -> str:
+    """Normalize Zoho module names."""
+    return MODULE_ALIASES.get(module, module)
@@ -66,8 +66,7 @@ def run_analysis(raw_dir: Path, output_dir: Path, client_name: str = "Client"):
     
     # Save Rosetta Stone for reference
     rosetta_path = output_dir / 'rosetta_stone.json'
-    with open(rosetta_path, 'w', encoding='utf-8') as f:
-        json.dump(rosetta.to_dict(), f, indent=2, ensure_ascii=False)
+    rosetta.write_json(rosetta_path)
     logger.info(f"Rosetta Stone saved to {rosetta_path}")
     
     # =====================================================
@@ -76,16 +75,11 @@ def run_analysis(raw_dir: Path, output_dir: Path, client_name: str = "Client"):
     logger.info("Phase 2: Registering fields in usage tracker...")
     tracker = UsageTracker()
     
-    for module_name in rosetta.get_all_modules():
-        for field in rosetta.get_module_fields(module_name):
-            tracker.register_field(
-                module=field.module,
-                field_label=field.field_label,
-                api_name=field.api_name,
-                column_name=field.column_name,
-                field_id=field.field_id,
-                data_type=field.data_type,
-            )
+    tracker.register_fields_bulk(
+        (f.module, f.field_label, f.api_name, f.column_name, f.field_id, f.data_type)
+        for module_name in rosetta.get_all_modules()
+        for f in rosetta.get_module_fields(module_name)
+    )
     
     initial_stats = tracker.stats()
     logger.info(f"Registered {initial_stats['total_fields']} fields "
@@ -139,10 +133,8 @@ def run_analysis(raw_dir: Path, output_dir: Path, client_name: str = "Client"):
     logger.info(f"Generated {len(tracker.get_all_modules())} module synopses")
     
     # Detailed field pages (only for used fields to keep output manageable)
-    used_fields = tracker.get_used_fields()
-    for profile in used_fields:
-        output.generate_field_detail(profile, output_dir)
-    logger.info(f"Generated {len(used_fields)} field detail pages")
+    detail_count = output.generate_field_details(tracker.iter_used_fields(), output_dir)
+    logger.info(f"Generated {detail_count} field detail pages")
     
     # AI-readable JSON
     ai_path = output.generate_ai_export(tracker, output_dir)
@@ -6,15 +6,30 @@ Generates:
   2. Detailed field analysis (Goal 2b) - full usage profile per field  
   3. AI-readable JSON export
 """
+import io
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
 
-from .usage import UsageTracker, FieldProfile, UsageType, SourceType
+try:
+    import orjson  # optional: much faster JSON serialization
+except ImportError:
+    orjson = None
+
+from .usage import UsageTracker, FieldProfile, SourceType
 
 logger = logging.getLogger(__name__)
 
+# Below this many field pages, process pool startup costs more than it saves
+PARALLEL_MIN_FIELDS = 200
+
+# Flags for writing a page with one os.open/os.write/os.close
+_PAGE_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
 
 def generate_module_synopsis(tracker: UsageTracker, module: str, 
                               output_dir: Path) -> Path:
@@ -29,37 +44,39 @@ def generate_module_synopsis(tracker: UsageTracker, module: str,
     used = [p for p in profiles if p.is_used]
     unused = [p for p in profiles if not p.is_used]
     
-    lines = []
-    lines.append(f"# {module} - Field Synopsis")
-    lines.append("")
-    lines.append(f"**Total fields:** {len(profiles)} | "
-                 f"**Used in automation:** {len(used)} | "
-                 f"**Not used:** {len(unused)}")
-    lines.append("")
+    buf = io.StringIO()
+    out = buf.write
+    out(f"# {module} - Field Synopsis\n")
+    out("\n")
+    out(f"**Total fields:** {len(profiles)} | "
+        f"**Used in automation:** {len(used)} | "
+        f"**Not used:** {len(unused)}\n")
+    out("\n")
     
     # Field table
-    lines.append("## Fields")
-    lines.append("")
-    lines.append("| Field Label | API Name | Type | Usage | Detail |")
-    lines.append("|---|---|---|---|---|")
+    out("## Fields\n")
+    out("\n")
+    out("| Field Label | API Name | Type | Usage | Detail |\n")
+    out("|---|---|---|---|---|\n")
     
-    for p in profiles:
-        usage = p.usage_summary
-        detail_link = f"[detail](fields/{module}_{p.api_name}.md)"
-        lines.append(f"| {p.field_label} | `{p.api_name}` | {p.data_type} | {usage} | {detail_link} |")
+    buf.writelines(
+        f"| {p.field_label} | `{p.api_name}` | {p.data_type} | {p.usage_summary} "
+        f"| [detail](fields/{module}_{p.api_name}.md) |\n"
+        for p in profiles
+    )
     
-    lines.append("")
+    out("\n")
     
     # Summary by usage type
-    lines.append("## Usage Summary")
-    lines.append("")
-    lines.append(f"- **Read in conditions:** {sum(len(p.reads) for p in profiles)} times across {sum(1 for p in profiles if p.reads)} fields")
-    lines.append(f"- **Written by automation:** {sum(len(p.writes) for p in profiles)} times across {sum(1 for p in profiles if p.writes)} fields")
-    lines.append(f"- **Manual entry (blueprints):** {sum(len(p.entries) for p in profiles)} times across {sum(1 for p in profiles if p.entries)} fields")
-    lines.append("")
+    out("## Usage Summary\n")
+    out("\n")
+    out(f"- **Read in conditions:** {sum(len(p.reads) for p in profiles)} times across {sum(1 for p in profiles if p.reads)} fields\n")
+    out(f"- **Written by automation:** {sum(len(p.writes) for p in profiles)} times across {sum(1 for p in profiles if p.writes)} fields\n")
+    out(f"- **Manual entry (blueprints):** {sum(len(p.entries) for p in profiles)} times across {sum(1 for p in profiles if p.entries)} fields\n")
+    out("\n")
     
     filepath = output_dir / f"{module}_synopsis.md"
-    filepath.write_text('\n'.join(lines), encoding='utf-8')
+    _write_md(filepath, buf)
     return filepath
 
 
@@ -73,38 +90,39 @@ def generate_field_detail(profile: FieldProfile, output_dir: Path) -> Path:
     - Where it's updated and to what values
     - Where it's evaluated and for what conditions
     """
-    lines = []
-    lines.append(f"# {profile.module}.{profile.api_name}")
-    lines.append("")
+    buf = io.StringIO()
+    out = buf.write
+    out(f"# {profile.module}.{profile.api_name}\n")
+    out("\n")
     
     # Basic info
-    lines.append("## Field Info")
-    lines.append("")
-    lines.append(f"| Property | Value |")
-    lines.append(f"|---|---|")
-    lines.append(f"| **Label** | {profile.field_label} |")
-    lines.append(f"| **API Name** | `{profile.api_name}` |")
-    lines.append(f"| **Column Name** | `{profile.column_name}` |")
-    lines.append(f"| **Field ID** | `{profile.field_id}` |")
-    lines.append(f"| **Data Type** | {profile.data_type} |")
-    lines.append(f"| **Module** | {profile.module} |")
-    lines.append("")
+    out("## Field Info\n")
+    out("\n")
+    out(f"| Property | Value |\n")
+    out(f"|---|---|\n")
+    out(f"| **Label** | {profile.field_label} |\n")
+    out(f"| **API Name** | `{profile.api_name}` |\n")
+    out(f"| **Column Name** | `{profile.column_name}` |\n")
+    out(f"| **Field ID** | `{profile.field_id}` |\n")
+    out(f"| **Data Type** | {profile.data_type} |\n")
+    out(f"| **Module** | {profile.module} |\n")
+    out("\n")
     
     # Usage summary
-    lines.append("## Usage Summary")
-    lines.append("")
+    out("## Usage Summary\n")
+    out("\n")
     if not profile.is_used:
-        lines.append("**This field is not used in any automation.**")
+        out("**This field is not used in any automation.**\n")
     else:
-        lines.append(f"- **Read (evaluated):** {len(profile.reads)} times")
-        lines.append(f"- **Written (updated):** {len(profile.writes)} times")
-        lines.append(f"- **Manual entry:** {len(profile.entries)} times")
-    lines.append("")
+        out(f"- **Read (evaluated):** {len(profile.reads)} times\n")
+        out(f"- **Written (updated):** {len(profile.writes)} times\n")
+        out(f"- **Manual entry:** {len(profile.entries)} times\n")
+    out("\n")
     
     # WRITES - where is this field updated?
     if profile.writes:
-        lines.append("## Written By (Field Updates)")
-        lines.append("")
+        out("## Written By (Field Updates)\n")
+        out("\n")
         
         # Group by source type
         bp_writes = [w for w in profile.writes if w.source_type == SourceType.BLUEPRINT]
@@ -112,73 +130,73 @@ def generate_field_detail(profile: FieldProfile, output_dir: Path) -> Path:
         fn_writes = [w for w in profile.writes if w.source_type == SourceType.FUNCTION]
         
         if bp_writes:
-            lines.append("### Blueprint Updates")
-            lines.append("")
+            out("### Blueprint Updates\n")
+            out("\n")
             for w in bp_writes:
                 value = w.details.get('value', '')
                 update_name = w.details.get('update_name', '')
-                lines.append(f"- **{w.source_name}**")
+                out(f"- **{w.source_name}**\n")
                 if value:
-                    lines.append(f"  - Set to: `{value}`")
+                    out(f"  - Set to: `{value}`\n")
                 if update_name:
-                    lines.append(f"  - Update action: {update_name}")
-            lines.append("")
+                    out(f"  - Update action: {update_name}\n")
+            out("\n")
         
         if wf_writes:
-            lines.append("### Workflow Updates")
-            lines.append("")
+            out("### Workflow Updates\n")
+            out("\n")
             for w in wf_writes:
                 value = w.details.get('value', '')
                 action_name = w.details.get('action_name', '')
                 update_type = w.details.get('update_type', '')
-                lines.append(f"- **{w.source_name}**")
+                out(f"- **{w.source_name}**\n")
                 if action_name:
-                    lines.append(f"  - Action: {action_name}")
+                    out(f"  - Action: {action_name}\n")
                 if value:
-                    lines.append(f"  - Set to: `{value}`")
+                    out(f"  - Set to: `{value}`\n")
                 if update_type:
-                    lines.append(f"  - Type: {update_type}")
-            lines.append("")
+                    out(f"  - Type: {update_type}\n")
+            out("\n")
         
         if fn_writes:
-            lines.append("### Function Updates")
-            lines.append("")
+            out("### Function Updates\n")
+            out("\n")
             for w in fn_writes:
                 line_num = w.details.get('line', '')
                 context = w.details.get('context', '')
-                lines.append(f"- **{w.source_name}**")
+                out(f"- **{w.source_name}**\n")
                 if line_num:
-                    lines.append(f"  - Line: {line_num}")
+                    out(f"  - Line: {line_num}\n")
                 if context:
-                    lines.append(f"  - Code: `{context}`")
-            lines.append("")
+                    out(f"  - Code: `{context}`\n")
+            out("\n")
     
     # READS - where is this field evaluated?
     if profile.reads:
-        lines.append("## Read By (Evaluated In)")
-        lines.append("")
+        out("## Read By (Evaluated In)\n")
+        out("\n")
         
         bp_reads = [r for r in profile.reads if r.source_type == SourceType.BLUEPRINT]
         wf_reads = [r for r in profile.reads if r.source_type == SourceType.WORKFLOW]
         fn_reads = [r for r in profile.reads if r.source_type == SourceType.FUNCTION]
         
         if bp_reads:
-            lines.append("### Blueprint Conditions")
-            lines.append("")
+            out("### Blueprint Conditions\n")
+            out("\n")
             for r in bp_reads:
-                lines.append(f"- **{r.source_name}**")
+                out(f"- **{r.source_name}**\n")
                 criteria = r.details.get('criteria_string', '')
                 if criteria:
-                    lines.append(f"  - Criteria: {criteria[:200]}")
-            lines.append("")
+                    out(f"  - Criteria: {criteria[:200]}\n")
+            out("\n")
         
         if wf_reads:
-            lines.append("### Workflow Conditions")
-            lines.append("")
+            out("### Workflow Conditions\n")
+            out("\n")
             for r in wf_reads:
                 comparator = r.details.get('comparator', '')
                 value = r.details.get('value', '')
-                lines.append(f"- **{r.source_name}**")
+                out(f"- **{r.source_name}**\n")
                 if comparator:
                     cond = f"{comparator}"
                     if value:
@@ -186,34 +204,69 @@ def generate_field_detail(profile: FieldProfile, output_dir: Path) -> Path:
                             cond += f" [{', '.join(str(v) for v in value)}]"
                         else:
                             cond += f" `{value}`"
-                    lines.append(f"  - Condition: {cond}")
-            lines.append("")
+                    out(f"  - Condition: {cond}\n")
+            out("\n")
         
         if fn_reads:
-            lines.append("### Function Reads")
-            lines.append("")
+            out("### Function Reads\n")
+            out("\n")
             for r in fn_reads:
                 line_num = r.details.get('line', '')
-                lines.append(f"- **{r.source_name}**" + (f" (line {line_num})" if line_num else ""))
-            lines.append("")
+                out(f"- **{r.source_name}**" + (f" (line {line_num})" if line_num else "") + "\n")
+            out("\n")
     
     # ENTRIES - blueprint manual entry
     if profile.entries:
-        lines.append("## Manual Entry (Blueprint DURING Tab)")
-        lines.append("")
+        out("## Manual Entry (Blueprint DURING Tab)\n")
+        out("\n")
         for e in profile.entries:
             mandatory = "Required" if e.details.get('mandatory') else "Optional"
-            lines.append(f"- **{e.source_name}** ({mandatory})")
-        lines.append("")
+            out(f"- **{e.source_name}** ({mandatory})\n")
+        out("\n")
     
     # Write file
     fields_dir = output_dir / 'fields'
     fields_dir.mkdir(exist_ok=True)
     filepath = fields_dir / f"{profile.module}_{profile.api_name}.md"
-    filepath.write_text('\n'.join(lines), encoding='utf-8')
+    _write_md(filepath, buf)
     return filepath
 
 
+def generate_field_details(profiles: Iterable[FieldProfile], output_dir: Path,
+                           max_workers: Optional[int] = None) -> int:
+    """
+    Write a detail page for each profile (see generate_field_detail).
+    
+    Pages are independent, so past PARALLEL_MIN_FIELDS they are rendered
+    and written in worker processes. profiles may be a generator (e.g.
+    UsageTracker.iter_used_fields()); only the first PARALLEL_MIN_FIELDS
+    are pulled ahead to pick serial or parallel.
+    
+    Args:
+        profiles: Field profiles to document
+        output_dir: Output root (pages go in its fields/ subdirectory)
+        max_workers: Worker process count (default: CPU count).
+                     1 forces serial generation.
+    
+    Returns:
+        Number of pages written
+    """
+    profiles = iter(profiles)
+    head = list(islice(profiles, PARALLEL_MIN_FIELDS))
+    count = 0
+    if max_workers == 1 or len(head) < PARALLEL_MIN_FIELDS:
+        for profile in chain(head, profiles):
+            generate_field_detail(profile, output_dir)
+            count += 1
+    else:
+        (output_dir / "fields").mkdir(exist_ok=True)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for _ in executor.map(generate_field_detail, chain(head, profiles),
+                                  repeat(output_dir), chunksize=32):
+                count += 1
+    return count
+
+
 def generate_ai_export(tracker: UsageTracker, output_dir: Path) -> Path:
     """
     AI-readable JSON export of the complete field analysis.
@@ -261,43 +314,48 @@ def generate_ai_export(tracker: UsageTracker, output_dir: Path) -> Path:
         export["modules"][module] = module_data
     
     filepath = output_dir / "field_analysis.json"
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(export, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        filepath.write_bytes(orjson.dumps(
+            export, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(export, f, indent=2, ensure_ascii=False)
     
     return filepath
 
 
 def generate_master_index(tracker: UsageTracker, output_dir: Path) -> Path:
     """Generate a master index linking to all module synopses."""
-    lines = []
-    lines.append("# Zoho CRM Field Analysis")
-    lines.append("")
+    buf = io.StringIO()
+    out = buf.write
+    out("# Zoho CRM Field Analysis\n")
+    out("\n")
     
     stats = tracker.stats()
-    lines.append(f"**Total fields analyzed:** {stats['total_fields']}")
-    lines.append(f"**Fields used in automation:** {stats['used_fields']}")
-    lines.append(f"**Fields not in automation:** {stats['unused_fields']}")
-    lines.append(f"**Total read references:** {stats['total_reads']}")
-    lines.append(f"**Total write references:** {stats['total_writes']}")
-    lines.append(f"**Total manual entry references:** {stats['total_entries']}")
-    lines.append("")
-    
-    lines.append("## Modules")
-    lines.append("")
-    lines.append("| Module | Total Fields | Used | Unused | Synopsis |")
-    lines.append("|---|---|---|---|---|")
+    out(f"**Total fields analyzed:** {stats['total_fields']}\n")
+    out(f"**Fields used in automation:** {stats['used_fields']}\n")
+    out(f"**Fields not in automation:** {stats['unused_fields']}\n")
+    out(f"**Total read references:** {stats['total_reads']}\n")
+    out(f"**Total write references:** {stats['total_writes']}\n")
+    out(f"**Total manual entry references:** {stats['total_entries']}\n")
+    out("\n")
+    
+    out("## Modules\n")
+    out("\n")
+    out("| Module | Total Fields | Used | Unused | Synopsis |\n")
+    out("|---|---|---|---|---|\n")
     
     for module in sorted(tracker.get_all_modules()):
         profiles = tracker.get_module_profiles(module)
         used = sum(1 for p in profiles if p.is_used)
         unused = len(profiles) - used
         link = f"[{module}]({module}_synopsis.md)"
-        lines.append(f"| {link} | {len(profiles)} | {used} | {unused} | [view]({module}_synopsis.md) |")
+        out(f"| {link} | {len(profiles)} | {used} | {unused} | [view]({module}_synopsis.md) |\n")
     
-    lines.append("")
+    out("\n")
     
     filepath = output_dir / "INDEX.md"
-    filepath.write_text('\n'.join(lines), encoding='utf-8')
+    _write_md(filepath, buf)
     return filepath
 
 
@@ -363,27 +421,61 @@ def generate_html_viewer(tracker: UsageTracker, output_dir: Path,
         modules_export[module] = {"fields": fields}
     
     payload = {"summary": summary, "modules": modules_export}
-    payload_json = json.dumps(payload, separators=(',', ':'))
+    if orjson is not None:
+        payload_json = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    else:
+        payload_json = json.dumps(payload, separators=(',', ':'))
     
-    # Inject data and client name into template
-    data_script = f'DATA = {payload_json};'
-    html = template.replace('// __DATA_INJECT__', data_script)
-    html = html.replace('>BLADES<', f'>{client_name.upper()}<')
+    # Split the template at the data marker and write template, payload,
+    # template straight to disk - the full page is never built in memory.
+    # The badge is filled in on the template pieces only, never the data.
+    badge = f'>{client_name.upper()}<'
+    head, marker, tail = template.partition('// __DATA_INJECT__')
     
     # Write output
     safe_name = client_name.lower().replace(' ', '_')
     filepath = output_dir / f"{safe_name}_field_analysis.html"
-    filepath.write_text(html, encoding='utf-8')
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write(head.replace('>BLADES<', badge))
+        if marker:
+            f.write('DATA = ')
+            f.write(payload_json)
+            f.write(';')
+        f.write(tail.replace('>BLADES<', badge))
     
     logger.info(f"HTML viewer: {filepath} ({filepath.stat().st_size / 1024:.0f} KB)")
     return filepath
 
 
+def _write_md(filepath: Path, buf: io.StringIO):
+    """
+    Write a Markdown page built line by line in buf.
+    
+    Every page closes with a blank line; its last newline is dropped so
+    files end exactly as they did when the lines were joined.
+    
+    Pages are written with raw os.open/os.write: there are thousands of
+    them, and a buffered text file costs extra system calls per open
+    (noticeable on network shares). Newlines are translated like text
+    mode would.
+    """
+    text = buf.getvalue()[:-1]
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(filepath, _PAGE_OPEN_FLAGS, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 def _usage_to_dict(usage) -> dict:
     """Convert a FieldUsage to a serializable dict."""
     return {
-        "type": usage.usage_type.value,
-        "source_type": usage.source_type.value,
+        "type": usage.usage_type,
+        "source_type": usage.source_type,
         "source_name": usage.source_name,
         "source_id": usage.source_id,
         "details": usage.details,
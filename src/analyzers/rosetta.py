@@ -11,28 +11,77 @@ Each module gets its own mapping table since field names are module-scoped.
 """
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from sys import intern
+from typing import Dict, Optional, List, Any, Tuple
+
+try:
+    import ijson  # optional: stream very large module files
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster whole-file parse
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Below this many module files, process pool startup costs more than it saves
+PARALLEL_MIN_MODULES = 64
+
+# Module files this large are streamed (with ijson) instead of parsed whole.
+# Streaming saves memory but is several times slower than orjson.loads, so
+# it is kept for files whose parsed tree would be big enough to matter.
+STREAM_MIN_BYTES = 16 * 1024 * 1024
+
+# FieldEntry attributes exported by RosettaStone.to_dict(), in output order
+_DICT_KEYS = ('field_label', 'api_name', 'column_name', 'field_id', 'data_type')
+_dict_values = attrgetter(*_DICT_KEYS)
+_label_sort_key = attrgetter('label_lc')
+
+
+def _field_rows(fields: List['FieldEntry']) -> List[dict]:
+    """A module's fields as to_dict() rows, sorted by label."""
+    return [dict(zip(_DICT_KEYS, _dict_values(f)))
+            for f in sorted(fields, key=_label_sort_key)]
+
+
+def _dumps_indented(obj) -> bytes:
+    """UTF-8 JSON with 2-space indent, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _intern(value):
+    """sys.intern for strings; anything else (e.g. a null from JSON) as-is."""
+    return intern(value) if type(value) is str else value
+
 
 class FieldEntry:
     """Single field with all its name variants and metadata."""
     
     __slots__ = ['module', 'field_label', 'api_name', 'column_name',
-                 'field_id', 'data_type', 'raw']
+                 'field_id', 'data_type', 'raw', 'label_lc']
     
     def __init__(self, module: str, field_label: str, api_name: str,
                  column_name: str, field_id: str, data_type: str,
-                 raw: dict):
-        self.module = module
+                 raw: Optional[dict] = None):
+        # Names and ids are interned: they repeat across modules, usages
+        # and lookup keys, and interned keys compare by identity
+        self.module = _intern(module)
         self.field_label = field_label
-        self.api_name = api_name
-        self.column_name = column_name
-        self.field_id = field_id
-        self.data_type = data_type
-        self.raw = raw  # Full field definition from modules JSON
+        self.api_name = _intern(api_name)
+        self.column_name = _intern(column_name)
+        self.field_id = _intern(field_id)
+        self.data_type = _intern(data_type)
+        self.raw = raw  # Full field definition from modules JSON, if kept
+        self.label_lc = field_label.lower()  # sort key, computed once
     
     def __repr__(self):
         return f"Field({self.module}.{self.api_name})"
@@ -51,41 +100,62 @@ class RosettaStone:
     """
     
     def __init__(self):
-        # module -> {lookup_key -> FieldEntry}
-        self._by_api_name: Dict[str, Dict[str, FieldEntry]] = {}
-        self._by_column_name: Dict[str, Dict[str, FieldEntry]] = {}
-        self._by_label: Dict[str, Dict[str, FieldEntry]] = {}
-        self._by_id: Dict[str, Dict[str, FieldEntry]] = {}
+        # (kind, module, lookup_key) -> FieldEntry, kind being one of
+        # 'api', 'col', 'label', 'id': one table, one probe per lookup
+        self._index: Dict[Tuple[str, str, str], FieldEntry] = {}
         # Also a flat id lookup (IDs are globally unique)
         self._global_by_id: Dict[str, FieldEntry] = {}
         # Module name normalization (Potentials -> Deals, etc.)
         self._module_aliases: Dict[str, str] = {}
         # All modules
         self.modules: Dict[str, List[FieldEntry]] = {}
+        # Module -> the file it was read from, for get_raw() re-reads
+        self._module_files: Dict[str, Path] = {}
+        # to_dict() result, dropped whenever a module is (re)registered
+        self._dict_cache: Optional[dict] = None
+        # Per-instance memos over the two dicts above; only a few dozen
+        # module names and a working set of ids recur. Cleared whenever
+        # those dicts change.
+        aliases, global_by_id = self._module_aliases, self._global_by_id
+        self._normalize_module = lru_cache(maxsize=64)(
+            lambda module: aliases.get(module, module))
+        self._lookup_id = lru_cache(maxsize=1024)(
+            lambda field_id: global_by_id.get(str(field_id)))
     
     @classmethod
-    def from_raw_modules(cls, modules_dir: Path) -> 'RosettaStone':
-        """Build from raw modules extraction directory."""
+    def from_raw_modules(cls, modules_dir: Path,
+                         max_workers: Optional[int] = None,
+                         keep_raw: bool = False) -> 'RosettaStone':
+        """
+        Build from raw modules extraction directory.
+        
+        Module files are independent, so once there are enough of them
+        they are parsed in worker processes; FieldEntry objects are only
+        built here, in file order.
+        
+        Args:
+            modules_dir: Directory of extracted module *.json files
+            max_workers: Worker process count (default: CPU count).
+                         1 forces a serial parse.
+            keep_raw: Keep each field's full definition on FieldEntry.raw.
+                      Off by default to save memory; get_raw() re-reads
+                      a definition from its module file when needed.
+        """
         rosetta = cls()
         
-        for module_file in sorted(modules_dir.glob("*.json")):
-            if module_file.name in ('all_modules.json',):
-                continue
-            
-            with open(module_file) as f:
-                data = json.load(f)
-            
-            metadata = data.get('metadata', {})
-            fields_data = data.get('fields', {})
-            fields = fields_data.get('fields', [])
-            
-            module_name = metadata.get('api_name', module_file.stem)
-            
-            if not fields:
-                logger.debug(f"No fields in {module_file.name}, skipping")
-                continue
-            
-            rosetta._register_module(module_name, fields, metadata)
+        # scandir's DirEntry answers is_file() without another stat call
+        with os.scandir(modules_dir) as it:
+            module_files = [Path(e.path) for e in sorted(it, key=lambda e: e.name)
+                            if e.name.endswith('.json') and e.name != 'all_modules.json'
+                            and e.is_file()]
+        
+        if max_workers == 1 or len(module_files) < PARALLEL_MIN_MODULES:
+            rosetta._register_module_files(
+                module_files, map(_load_module_file, module_files), keep_raw)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                rosetta._register_module_files(
+                    module_files, executor.map(_load_module_file, module_files), keep_raw)
         
         # Build common aliases
         rosetta._build_aliases()
@@ -94,36 +164,55 @@ class RosettaStone:
                      f"{sum(len(v) for v in rosetta.modules.values())} fields")
         return rosetta
     
-    def _register_module(self, module_name: str, fields: list, metadata: dict):
+    def _register_module_files(self, module_files: List[Path], parsed,
+                               keep_raw: bool = True):
+        """Register each file's (metadata, fields) from _load_module_file."""
+        for module_file, (metadata, fields) in zip(module_files, parsed):
+            module_name = metadata.get('api_name', module_file.stem)
+            
+            if not fields:
+                logger.debug(f"No fields in {module_file.name}, skipping")
+                continue
+            
+            self._register_module(module_name, fields, metadata, keep_raw)
+            self._module_files[module_name] = module_file
+    
+    def _register_module(self, module_name: str, fields: list, metadata: dict,
+                         keep_raw: bool = True):
         """Register all fields for a module."""
-        self._by_api_name[module_name] = {}
-        self._by_column_name[module_name] = {}
-        self._by_label[module_name] = {}
-        self._by_id[module_name] = {}
-        self.modules[module_name] = []
-        
-        for field_raw in fields:
-            entry = FieldEntry(
+        self._unregister_module(module_name)
+        entries = self.modules[module_name] = [
+            FieldEntry(
                 module=module_name,
                 field_label=field_raw.get('field_label', ''),
                 api_name=field_raw.get('api_name', ''),
                 column_name=field_raw.get('column_name', ''),
                 field_id=str(field_raw.get('id', '')),
                 data_type=field_raw.get('data_type', ''),
-                raw=field_raw
+                raw=field_raw if keep_raw else None
             )
-            
-            self.modules[module_name].append(entry)
-            
-            if entry.api_name:
-                self._by_api_name[module_name][entry.api_name] = entry
-            if entry.column_name:
-                self._by_column_name[module_name][entry.column_name] = entry
-            if entry.field_label:
-                self._by_label[module_name][entry.field_label] = entry
-            if entry.field_id:
-                self._by_id[module_name][entry.field_id] = entry
-                self._global_by_id[entry.field_id] = entry
+            for field_raw in fields
+        ]
+        
+        # One comprehension per lookup kind; later fields win on collisions
+        index = self._index
+        index.update({('api', module_name, e.api_name): e for e in entries if e.api_name})
+        index.update({('col', module_name, e.column_name): e for e in entries if e.column_name})
+        index.update({('label', module_name, e.field_label): e for e in entries if e.field_label})
+        index.update({('id', module_name, e.field_id): e for e in entries if e.field_id})
+        self._global_by_id.update({e.field_id: e for e in entries if e.field_id})
+        
+        self._dict_cache = None
+        self._lookup_id.cache_clear()
+    
+    def _unregister_module(self, module_name: str):
+        """Drop a module's lookup entries before it is registered again."""
+        pop = self._index.pop
+        for entry in self.modules.pop(module_name, ()):
+            pop(('api', module_name, entry.api_name), None)
+            pop(('col', module_name, entry.column_name), None)
+            pop(('label', module_name, entry.field_label), None)
+            pop(('id', module_name, entry.field_id), None)
     
     def _build_aliases(self):
         """Build module name aliases (Zoho internal names → API names)."""
@@ -135,10 +224,7 @@ class RosettaStone:
         for alias, canonical in alias_map.items():
             if canonical in self.modules:
                 self._module_aliases[alias] = canonical
-    
-    def _normalize_module(self, module: str) -> str:
-        """Resolve module aliases."""
-        return self._module_aliases.get(module, module)
+        self._normalize_module.cache_clear()
     
     def resolve(self, module: str, *, api_name: str = None,
                 column_name: str = None, field_label: str = None,
@@ -147,30 +233,55 @@ class RosettaStone:
         Resolve a field using any naming convention.
         
         Exactly one of api_name, column_name, field_label, or field_id must be provided.
+        Callers that know which one they have should use the matching
+        resolve_* method below, which skips the keyword checks.
         """
-        module = self._normalize_module(module)
-        
         if field_id:
-            # Try module-specific first, then global
-            entry = self._by_id.get(module, {}).get(field_id)
-            if entry:
-                return entry
-            return self._global_by_id.get(field_id)
-        
+            return self.resolve_field_id(module, field_id)
         if api_name:
-            return self._by_api_name.get(module, {}).get(api_name)
-        
+            return self.resolve_api_name(module, api_name)
         if column_name:
-            return self._by_column_name.get(module, {}).get(column_name)
-        
+            return self.resolve_column_name(module, column_name)
         if field_label:
-            return self._by_label.get(module, {}).get(field_label)
-        
+            return self.resolve_label(module, field_label)
         return None
     
+    def resolve_api_name(self, module: str, api_name: str) -> Optional[FieldEntry]:
+        """Resolve a field by API name."""
+        return self._index.get(('api', self._normalize_module(module), api_name))
+    
+    def resolve_column_name(self, module: str, column_name: str) -> Optional[FieldEntry]:
+        """Resolve a field by database column name."""
+        return self._index.get(('col', self._normalize_module(module), column_name))
+    
+    def resolve_label(self, module: str, field_label: str) -> Optional[FieldEntry]:
+        """Resolve a field by display label."""
+        return self._index.get(('label', self._normalize_module(module), field_label))
+    
+    def resolve_field_id(self, module: str, field_id: str) -> Optional[FieldEntry]:
+        """Resolve a field by ID, trying the module first, then all modules."""
+        entry = self._index.get(('id', self._normalize_module(module), field_id))
+        if entry:
+            return entry
+        return self._global_by_id.get(field_id)
+    
+    def get_raw(self, entry: FieldEntry) -> Optional[dict]:
+        """
+        Full field definition for an entry.
+        
+        Entries built without keep_raw have no raw dict; it is read back
+        from the module file instead (recently used files stay parsed).
+        """
+        if entry.raw is not None:
+            return entry.raw
+        module_file = self._module_files.get(entry.module)
+        if module_file is None:
+            return None
+        return _module_fields_by_id(module_file).get(entry.field_id)
+    
     def resolve_by_id(self, field_id: str) -> Optional[FieldEntry]:
         """Resolve field by ID only (globally unique)."""
-        return self._global_by_id.get(str(field_id))
+        return self._lookup_id(field_id)
     
     def get_module_fields(self, module: str) -> List[FieldEntry]:
         """Get all fields for a module."""
@@ -182,17 +293,88 @@ class RosettaStone:
         return sorted(self.modules.keys())
     
     def to_dict(self) -> dict:
-        """Export as a serializable dictionary."""
-        result = {}
-        for module, fields in self.modules.items():
-            result[module] = [
-                {
-                    'field_label': f.field_label,
-                    'api_name': f.api_name,
-                    'column_name': f.column_name,
-                    'field_id': f.field_id,
-                    'data_type': f.data_type,
-                }
-                for f in sorted(fields, key=lambda x: x.field_label.lower())
-            ]
-        return result
+        """
+        Export as a serializable dictionary.
+        
+        The result is cached until a module is registered again, so
+        treat it as read-only.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                module: _field_rows(fields)
+                for module, fields in self.modules.items()
+            }
+        return self._dict_cache
+    
+    def write_json(self, path: Path) -> Path:
+        """
+        Write to_dict() to path as indented JSON, one module at a time.
+        
+        Output is the same as json.dump(to_dict(), indent=2,
+        ensure_ascii=False), but only one module's rows are built and
+        serialized at once, so the full dict and its full serialized
+        text are never both in memory (unless to_dict() is cached).
+        """
+        cached = self._dict_cache
+        with open(path, 'wb') as f:
+            sep = b'{\n  '
+            for module, fields in self.modules.items():
+                rows = cached[module] if cached is not None else _field_rows(fields)
+                # Nest the module's block one level in: JSON strings hold
+                # no raw newlines, so every newline is a line break
+                f.write(sep + _dumps_indented(module) + b': '
+                        + _dumps_indented(rows).replace(b'\n', b'\n  '))
+                sep = b',\n  '
+            f.write(b'{}' if sep == b'{\n  ' else b'\n}')
+        return path
+
+
+# Prefixes of the objects _load_module_file builds; nothing else is kept
+_MODULE_FILE_PREFIXES = frozenset(('metadata', 'fields.fields.item'))
+
+
+def _load_module_file(module_file: Path) -> Tuple[dict, list]:
+    """
+    Read (metadata, field definitions) from a module extraction file.
+    
+    Files under STREAM_MIN_BYTES are parsed whole, with orjson when it
+    is installed (json otherwise). Larger files are streamed once with
+    ijson, when it is installed: only the metadata object and the field
+    dicts under fields.fields are built, and the rest of the document is
+    skipped as it is parsed.
+    """
+    if ijson is None or module_file.stat().st_size < STREAM_MIN_BYTES:
+        if orjson is not None:
+            data = orjson.loads(module_file.read_bytes())
+        else:
+            with open(module_file) as f:
+                data = json.load(f)
+        return data.get('metadata', {}), data.get('fields', {}).get('fields', [])
+    
+    metadata = {}
+    fields = []
+    builder = None
+    target = None
+    with open(module_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if builder is None:
+                if event != 'start_map' or prefix not in _MODULE_FILE_PREFIXES:
+                    continue
+                builder = ijson.ObjectBuilder()
+                target = prefix
+            builder.event(event, value)
+            # A map is complete when its own prefix sees the closing event
+            if event == 'end_map' and prefix == target:
+                if target == 'metadata':
+                    metadata = builder.value
+                else:
+                    fields.append(builder.value)
+                builder = None
+    return metadata, fields
+
+
+@lru_cache(maxsize=8)
+def _module_fields_by_id(module_file: Path) -> Dict[str, dict]:
+    """Field definitions from a module file, keyed by (string) field id."""
+    _, fields = _load_module_file(module_file)
+    return {str(f.get('id', '')): f for f in fields}
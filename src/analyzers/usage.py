@@ -12,75 +12,90 @@ Each usage has a source attribution:
   - source_id: unique ID
   - details: context-specific info (value set, condition used, etc.)
 """
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
-from enum import Enum
+from collections import defaultdict
+from itertools import chain
+from sys import intern
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Tuple
 
 
-class UsageType(Enum):
-    READ = "read"
-    WRITE = "write"
-    ENTRY = "entry"  # Blueprint DURING tab - user manually enters
+# Usage and source types are plain interned strings rather than Enums:
+# they serialize as-is and compare without Enum.__eq__
+class UsageType:
+    READ = intern("read")
+    WRITE = intern("write")
+    ENTRY = intern("entry")  # Blueprint DURING tab - user manually enters
 
 
-class SourceType(Enum):
-    BLUEPRINT = "blueprint"
-    WORKFLOW = "workflow"
-    FUNCTION = "function"
+class SourceType:
+    BLUEPRINT = intern("blueprint")
+    WORKFLOW = intern("workflow")
+    FUNCTION = intern("function")
 
 
-@dataclass
 class FieldUsage:
     """Single instance of a field being used somewhere."""
-    usage_type: UsageType
-    source_type: SourceType
-    source_name: str          # e.g. "Inside Sales Process > Discovery Call Completed"
-    source_id: str            # Unique ID for linking
-    module: str               # Module this field belongs to
-    field_api_name: str       # API name of the field
-    details: Dict[str, Any] = field(default_factory=dict)
-    # details can include:
-    #   For WRITE: {"value": "Discovery Completed", "update_type": "static"}
-    #   For READ:  {"comparator": "equal", "value": ["Inbound Call", ...]}
-    #   For READ in Deluge: {"line": 42, "context": "if(DealInfo.get(\"Stage\") == ..."}
-    #   For WRITE in Deluge: {"line": 289, "target_module": "Deals", "value_expr": "FlagNotes"}
+    
+    __slots__ = ['usage_type', 'source_type', 'source_name', 'source_id',
+                 'module', 'field_api_name', 'details']
+    
+    def __init__(self, usage_type: str, source_type: str,
+                 source_name: str, source_id: str, module: str,
+                 field_api_name: str, details: Optional[Dict[str, Any]] = None):
+        self.usage_type = usage_type          # a UsageType constant
+        self.source_type = source_type        # a SourceType constant
+        self.source_name = source_name        # e.g. "Inside Sales Process > Discovery Call Completed"
+        self.source_id = source_id            # Unique ID for linking
+        self.module = module                  # Module this field belongs to
+        self.field_api_name = field_api_name  # API name of the field
+        self.details = {} if details is None else details
+        # details can include:
+        #   For WRITE: {"value": "Discovery Completed", "update_type": "static"}
+        #   For READ:  {"comparator": "equal", "value": ["Inbound Call", ...]}
+        #   For READ in Deluge: {"line": 42, "context": "if(DealInfo.get(\"Stage\") == ..."}
+        #   For WRITE in Deluge: {"line": 289, "target_module": "Deals", "value_expr": "FlagNotes"}
+    
+    def __repr__(self):
+        return (f"FieldUsage({self.usage_type} {self.module}.{self.field_api_name} "
+                f"from {self.source_name!r})")
 
 
-@dataclass  
 class FieldProfile:
     """Complete usage profile for a single field."""
-    module: str
-    field_label: str
-    api_name: str
-    column_name: str
-    field_id: str
-    data_type: str
     
-    reads: List[FieldUsage] = field(default_factory=list)
-    writes: List[FieldUsage] = field(default_factory=list)
-    entries: List[FieldUsage] = field(default_factory=list)
+    __slots__ = ['module', 'field_label', 'api_name', 'column_name',
+                 'field_id', 'data_type', 'reads', 'writes', 'entries',
+                 'total_usages', 'is_used']
     
-    @property
-    def is_used(self) -> bool:
-        return bool(self.reads or self.writes or self.entries)
+    def __init__(self, module: str, field_label: str, api_name: str,
+                 column_name: str, field_id: str, data_type: str):
+        self.module = module
+        self.field_label = field_label
+        self.api_name = api_name
+        self.column_name = column_name
+        self.field_id = field_id
+        self.data_type = data_type
+        
+        self.reads: List[FieldUsage] = []
+        self.writes: List[FieldUsage] = []
+        self.entries: List[FieldUsage] = []
+        # Kept up to date by add_usage() rather than recounted on access
+        self.total_usages = 0
+        self.is_used = False
     
-    @property
-    def total_usages(self) -> int:
-        return len(self.reads) + len(self.writes) + len(self.entries)
+    def __repr__(self):
+        return f"FieldProfile({self.module}.{self.api_name} {self.usage_summary})"
     
     @property
     def usage_summary(self) -> str:
         """Quick summary like 'R:5 W:3 E:2' or 'unused'."""
         if not self.is_used:
             return "unused"
-        parts = []
-        if self.reads:
-            parts.append(f"R:{len(self.reads)}")
+        summary = f"R:{len(self.reads)} " if self.reads else ""
         if self.writes:
-            parts.append(f"W:{len(self.writes)}")
+            summary += f"W:{len(self.writes)} "
         if self.entries:
-            parts.append(f"E:{len(self.entries)}")
-        return " ".join(parts)
+            summary += f"E:{len(self.entries)} "
+        return summary[:-1]
     
     def add_usage(self, usage: FieldUsage):
         if usage.usage_type == UsageType.READ:
@@ -89,24 +104,39 @@ class FieldProfile:
             self.writes.append(usage)
         elif usage.usage_type == UsageType.ENTRY:
             self.entries.append(usage)
+        else:
+            return
+        self.total_usages += 1
+        self.is_used = True
 
 
 class UsageTracker:
     """
     Aggregates field usage across all sources.
     
-    Key is (module, api_name) -> FieldProfile
+    Profiles are kept per module: module -> api_name -> FieldProfile,
+    so module-scoped queries only walk that module's fields.
+    
+    Totals for stats() are kept as running counters, so all usages must
+    go through add_usage()/add_usages() (not FieldProfile.add_usage directly).
     """
     
     def __init__(self):
-        self._profiles: Dict[tuple, FieldProfile] = {}
+        self._profiles: Dict[str, Dict[str, FieldProfile]] = defaultdict(dict)
+        self._n_fields = 0
+        self._n_used = 0
+        self._n_reads = 0
+        self._n_writes = 0
+        self._n_entries = 0
     
     def register_field(self, module: str, field_label: str, api_name: str,
                        column_name: str, field_id: str, data_type: str):
         """Register a field from the Rosetta Stone."""
-        key = (module, api_name)
-        if key not in self._profiles:
-            self._profiles[key] = FieldProfile(
+        module = intern(module)
+        api_name = intern(api_name)
+        fields = self._profiles[module]
+        if api_name not in fields:
+            fields[api_name] = FieldProfile(
                 module=module,
                 field_label=field_label,
                 api_name=api_name,
@@ -114,63 +144,136 @@ class UsageTracker:
                 field_id=field_id,
                 data_type=data_type,
             )
+            self._n_fields += 1
+    
+    def register_fields_bulk(self, fields: Iterable[Tuple[str, str, str, str, str, str]]):
+        """
+        Register many fields in one call.
+        
+        Each item is (module, field_label, api_name, column_name, field_id,
+        data_type). As with register_field, a field that is already
+        registered keeps its existing profile.
+        """
+        profiles = self._profiles
+        added = 0
+        for spec in fields:
+            module_fields = profiles[spec[0]]
+            if spec[2] not in module_fields:
+                module_fields[spec[2]] = FieldProfile(*spec)
+                added += 1
+        self._n_fields += added
     
     def add_usage(self, usage: FieldUsage):
         """Add a usage record. Creates profile if needed."""
-        key = (usage.module, usage.field_api_name)
-        if key not in self._profiles:
-            # Field referenced in automation but not in modules (orphan?)
-            self._profiles[key] = FieldProfile(
-                module=usage.module,
-                field_label=usage.field_api_name,  # Best guess
-                api_name=usage.field_api_name,
-                column_name="",
-                field_id="",
-                data_type="unknown",
-            )
-        self._profiles[key].add_usage(usage)
+        self.add_usages((usage,))
+    
+    def add_usages(self, usages: Iterable[FieldUsage]):
+        """
+        Add many usage records in one call (e.g. everything one workflow
+        or function produced). Same per-usage effect as add_usage; the
+        lookups are bound once and the counters updated once per batch.
+        """
+        profiles = self._profiles
+        read, write, entry = UsageType.READ, UsageType.WRITE, UsageType.ENTRY
+        n_fields = n_used = n_reads = n_writes = n_entries = 0
+        
+        for usage in usages:
+            # Interned, the names match registered (interned) keys by identity
+            module = intern(usage.module)
+            api_name = intern(usage.field_api_name)
+            fields = profiles[module]
+            profile = fields.get(api_name)
+            if profile is None:
+                # Field referenced in automation but not in modules (orphan?)
+                profile = fields[api_name] = FieldProfile(
+                    module=module,
+                    field_label=api_name,  # Best guess
+                    api_name=api_name,
+                    column_name="",
+                    field_id="",
+                    data_type="unknown",
+                )
+                n_fields += 1
+            
+            was_used = profile.is_used
+            profile.add_usage(usage)
+            usage_type = usage.usage_type
+            if usage_type == read:
+                n_reads += 1
+            elif usage_type == write:
+                n_writes += 1
+            elif usage_type == entry:
+                n_entries += 1
+            else:
+                continue
+            if not was_used:
+                n_used += 1
+        
+        self._n_fields += n_fields
+        self._n_used += n_used
+        self._n_reads += n_reads
+        self._n_writes += n_writes
+        self._n_entries += n_entries
     
     def get_profile(self, module: str, api_name: str) -> Optional[FieldProfile]:
-        return self._profiles.get((module, api_name))
+        fields = self._profiles.get(module)
+        return fields.get(api_name) if fields else None
     
     def get_module_profiles(self, module: str) -> List[FieldProfile]:
         """Get all field profiles for a module, sorted by label."""
-        return sorted(
-            [p for p in self._profiles.values() if p.module == module],
-            key=lambda p: p.field_label.lower()
-        )
+        fields = self._profiles.get(module)
+        if not fields:
+            return []
+        return sorted(fields.values(), key=lambda p: p.field_label.lower())
     
     def get_all_modules(self) -> List[str]:
-        return sorted(set(p.module for p in self._profiles.values()))
+        return sorted(m for m, fields in self._profiles.items() if fields)
+    
+    def iter_module_profiles(self) -> Iterator[Tuple[str, List[FieldProfile]]]:
+        """
+        Yield (module, profiles) for every module, in one walk.
+        
+        Same order as get_all_modules() + get_module_profiles().
+        """
+        for module in self.get_all_modules():
+            yield module, self.get_module_profiles(module)
+    
+    def iter_used_fields(self) -> Iterator[FieldProfile]:
+        """
+        Yield used fields in get_used_fields() order (module, then label)
+        without building the full list.
+        """
+        for _, profiles in self.iter_module_profiles():
+            for p in profiles:
+                if p.is_used:
+                    yield p
+    
+    def _iter_profiles(self, module: str = None) -> Iterable[FieldProfile]:
+        """All profiles, or just one module's when module is given."""
+        if module:
+            return self._profiles.get(module, {}).values()
+        return chain.from_iterable(m.values() for m in self._profiles.values())
     
     def get_used_fields(self, module: str = None) -> List[FieldProfile]:
         """Get only fields that are used in automation."""
-        profiles = self._profiles.values()
-        if module:
-            profiles = [p for p in profiles if p.module == module]
         return sorted(
-            [p for p in profiles if p.is_used],
+            [p for p in self._iter_profiles(module) if p.is_used],
             key=lambda p: (p.module, p.field_label.lower())
         )
     
     def get_unused_fields(self, module: str = None) -> List[FieldProfile]:
         """Get fields NOT used in any automation."""
-        profiles = self._profiles.values()
-        if module:
-            profiles = [p for p in profiles if p.module == module]
         return sorted(
-            [p for p in profiles if not p.is_used],
+            [p for p in self._iter_profiles(module) if not p.is_used],
             key=lambda p: (p.module, p.field_label.lower())
         )
     
     def stats(self) -> dict:
-        total = len(self._profiles)
-        used = sum(1 for p in self._profiles.values() if p.is_used)
         return {
-            'total_fields': total,
-            'used_fields': used,
-            'unused_fields': total - used,
-            'total_reads': sum(len(p.reads) for p in self._profiles.values()),
-            'total_writes': sum(len(p.writes) for p in self._profiles.values()),
-            'total_entries': sum(len(p.entries) for p in self._profiles.values()),
+            'total_fields': self._n_fields,
+            'used_fields': self._n_used,
+            'unused_fields': self._n_fields - self._n_used,
+            'total_reads': self._n_reads,
+            'total_writes': self._n_writes,
+            'total_entries': self._n_entries,
         }
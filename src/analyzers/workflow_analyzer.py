@@ -9,14 +9,45 @@ Extracts field usage from workflow rules:
 """
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from sys import intern
+from typing import List, Dict, Any, Optional
+
+try:
+    import orjson  # optional: much faster whole-file parse
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: stream workflow files instead of json.load
+except ImportError:
+    ijson = None
 
 from .rosetta import RosettaStone
 from .usage import FieldUsage, UsageType, SourceType, UsageTracker
 
 logger = logging.getLogger(__name__)
 
+# Top-level workflow keys the analyzer reads; anything else is skipped
+WORKFLOW_KEYS = frozenset(('name', 'id', 'module', 'conditions'))
+
+# Files in the workflows directory that are not single workflows
+_SKIP_FILES = frozenset(('workflows_index.json', 'FAILED_EXTRACTIONS.txt'))
+
+# Condition keys holding action lists
+_ACTION_GROUPS = ('instant_actions', 'scheduled_actions')
+
+# Detail values interned in the parent as results are recorded
+_INTERNED_DETAILS = ('comparator', 'update_type')
+
+# Below this many workflow files, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Workflow files this large are streamed (with ijson) instead of parsed whole
+STREAM_MIN_BYTES = 64 * 1024
+
 
 class WorkflowAnalyzer:
     """Analyze workflow rules for field usage."""
@@ -30,185 +61,330 @@ class WorkflowAnalyzer:
             'field_writes': 0,
             'function_refs': 0,
         }
+        # Function references collected by analyze_all, and where from
+        self._function_refs: Optional[List[dict]] = None
+        self._analyzed_dir: Optional[Path] = None
     
-    def analyze_all(self, workflows_dir: Path):
-        """Analyze all workflows."""
-        # Process each workflow file
-        for wf_file in sorted(workflows_dir.glob("*.json")):
-            if wf_file.name in ('workflows_index.json', 'FAILED_EXTRACTIONS.txt'):
-                continue
-            
-            try:
-                with open(wf_file) as f:
-                    wf_data = json.load(f)
-                
-                self._analyze_workflow(wf_data, wf_file)
-                self.stats['workflows_processed'] += 1
-                
-            except Exception as e:
-                logger.error(f"Error processing {wf_file.name}: {e}")
+    def analyze_all(self, workflows_dir: Path, max_workers: Optional[int] = None):
+        """
+        Analyze all workflows.
+        
+        Workflow files are parsed and scanned in worker processes once
+        there are enough of them to pay for the pool; tracker updates
+        always happen here, in file order. Function references are
+        collected in the same pass (see get_function_references).
+        
+        Args:
+            workflows_dir: Directory of extracted workflow *.json files
+            max_workers: Worker process count (default: CPU count).
+                         1 forces a serial scan.
+        """
+        self._function_refs = []
+        self._analyzed_dir = workflows_dir
+        self._record_results(_scan_workflow_files(workflows_dir, max_workers))
         
         logger.info(f"Workflow analysis complete: "
                      f"{self.stats['workflows_processed']} workflows, "
                      f"{self.stats['criteria_reads']} criteria reads, "
                      f"{self.stats['field_writes']} field writes")
     
-    def _analyze_workflow(self, wf: dict, wf_file: Path):
-        """Analyze a single workflow."""
-        wf_name = wf.get('name', wf_file.stem)
-        wf_id = str(wf.get('id', ''))
-        module_info = wf.get('module', {})
-        module = module_info.get('api_name', '') if isinstance(module_info, dict) else ''
+    def _record_results(self, results):
+        """Feed scan results into the tracker and stats."""
+        add_usages = self.tracker.add_usages
+        function_refs = self._function_refs
+        stats = self.stats
+        for file_name, usages, reads, writes, refs, error in results:
+            function_refs.extend(refs)
+            if error:
+                logger.error(f"Error processing {file_name}: {error}")
+                continue
+            _intern_details(usages)
+            add_usages(usages)
+            stats['criteria_reads'] += reads
+            stats['field_writes'] += writes
+            # Only workflows with a module count towards the stat (as they
+            # always have); get_function_references still returns them all
+            stats['function_refs'] += sum(1 for ref in refs if ref['module'])
+            stats['workflows_processed'] += 1
+    
+    def get_function_references(self, workflows_dir: Path) -> List[dict]:
+        """
+        Extract function names referenced by workflows.
         
-        if not module:
-            logger.debug(f"No module for workflow {wf_name}, skipping")
-            return
+        After analyze_all has run on the same directory these come from
+        that pass; otherwise the files are scanned here, without
+        touching the tracker. A file whose field usages fail still
+        contributes its references; only unreadable files (or a
+        malformed condition) contribute none.
+        """
+        if self._function_refs is not None and self._analyzed_dir == workflows_dir:
+            return list(self._function_refs)
         
-        source_label = f"Workflow: {wf_name}"
+        refs = []
+        for _, _, _, _, file_refs, _ in _scan_workflow_files(workflows_dir):
+            refs.extend(file_refs)
+        return refs
+
+
+def _scan_workflow_files(workflows_dir: Path, max_workers: Optional[int] = None):
+    """
+    Scan every workflow file, yielding _scan_workflow_file results in
+    file order; in a process pool past PARALLEL_MIN_FILES files.
+    """
+    wf_files = _workflow_files(workflows_dir)
+    
+    if max_workers == 1 or len(wf_files) < PARALLEL_MIN_FILES:
+        yield from map(_scan_workflow_file, wf_files)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(_scan_workflow_file, wf_files, chunksize=16)
+
+
+def _scan_workflow_file(wf_file: Path) -> tuple:
+    """
+    Load and scan one workflow file (runs in worker processes).
+    
+    Returns (file_name, usages, criteria_reads, field_writes,
+    function_refs, error); error is None unless the file failed. When
+    only its field usages failed, the function references are kept.
+    """
+    try:
+        usages, reads, writes, refs, error = _scan_workflow(_load_workflow(wf_file), wf_file)
+    except Exception as e:
+        return wf_file.name, (), 0, 0, (), str(e)
+    if error:
+        return wf_file.name, (), 0, 0, refs, error
+    return wf_file.name, usages, reads, writes, refs, None
+
+
+def _scan_workflow(wf: dict, wf_file: Path) -> tuple:
+    """
+    Collect a single workflow's field usages and function references
+    without touching a tracker.
+    
+    Returns (usages, criteria_reads, field_writes, function_refs, error).
+    Workflows without a module still report their function references.
+    A failure while collecting field usages (e.g. a non-string field
+    name) stops usage collection and comes back as error; the rest of
+    the workflow's function references are still collected.
+    """
+    usages: List[FieldUsage] = []
+    function_refs: List[dict] = []
+    
+    wf_name = wf.get('name', wf_file.stem)
+    wf_id = str(wf.get('id', ''))
+    error = None
+    module = _as_dict(wf.get('module')).get('api_name') or ''
+    if type(module) is str:
+        module = intern(module)
+    else:
+        # Reported as this file's error, rather than failing the tracker
+        # in the parent
+        error = f"module api_name is not a string: {module!r}"
+        module = ''
+    
+    if not module:
+        logger.debug(f"No module for workflow {wf_name}, skipping field usages")
+    
+    # Labels are built once per workflow; per-condition ones only when
+    # the workflow has a module, i.e. when usages can actually be recorded
+    cond_prefix = f"Workflow: {wf_name} (cond " if module else ''
+    ref_name = wf.get('name', '')
+    
+    # Process each condition block
+    for condition in wf.get('conditions', []):
+        cond_source = f"{cond_prefix}{condition.get('sequence_number', 0)})" if module else ''
         
-        # Process each condition block
-        for condition in wf.get('conditions', []):
-            seq = condition.get('sequence_number', 0)
-            cond_source = f"{source_label} (cond {seq})"
-            
-            # 1. Criteria - field evaluations (READs)
-            criteria_details = condition.get('criteria_details', {})
-            if criteria_details:
-                criteria = criteria_details.get('criteria')
-                if criteria:
-                    self._extract_criteria_reads(criteria, module, cond_source, wf_id)
-            
-            # 2. Instant actions
-            instant = condition.get('instant_actions', {})
-            if instant:
-                for action in instant.get('actions', []):
-                    self._process_action(action, module, cond_source, wf_id)
-            
-            # 3. Scheduled actions
-            scheduled = condition.get('scheduled_actions', {})
-            if isinstance(scheduled, dict):
-                for action in scheduled.get('actions', []):
-                    self._process_action(action, module, cond_source, wf_id)
-    
-    def _extract_criteria_reads(self, criteria: dict, module: str,
-                                 source_label: str, source_id: str):
-        """
-        Recursively extract field reads from criteria structure.
+        # 1. Criteria - field evaluations (READs)
+        if module and error is None:
+            criteria = _as_dict(condition.get('criteria_details')).get('criteria')
+            if criteria:
+                try:
+                    _extract_criteria_reads(criteria, module, cond_source, wf_id, usages)
+                except Exception as e:
+                    error = str(e)
         
-        Criteria can be:
-          - Simple: {"comparator": "equal", "field": {"api_name": "Phone"}, "value": ...}
-          - Group: {"group_operator": "AND", "group": [...criteria...]}
-        """
-        if not criteria or not isinstance(criteria, dict):
-            return
+        # 2. Instant and scheduled actions
+        for action_group in _ACTION_GROUPS:
+            for action in _as_dict(condition.get(action_group)).get('actions', []):
+                action_type = action.get('type', '')
+                if action_type == 'field_updates':
+                    if module and error is None:
+                        try:
+                            _process_field_update_action(action, module, cond_source, wf_id, usages)
+                        except Exception as e:
+                            error = str(e)
+                elif action_type == 'functions':
+                    # Function analysis handled by deluge analyzer
+                    function_refs.append({
+                        'function_name': action.get('name', ''),
+                        'function_id': str(action.get('id', '')),
+                        'workflow': ref_name,
+                        'module': module,
+                    })
+    
+    reads = sum(1 for u in usages if u.usage_type == UsageType.READ)
+    return usages, reads, len(usages) - reads, function_refs, error
+
+
+def _extract_criteria_reads(criteria: dict, module: str, source_label: str,
+                            source_id: str, usages: List[FieldUsage]):
+    """
+    Extract field reads from criteria structure.
+    
+    Criteria can be:
+      - Simple: {"comparator": "equal", "field": {"api_name": "Phone"}, "value": ...}
+      - Group: {"group_operator": "AND", "group": [...criteria...]}
+    
+    Groups nest; they are walked with an explicit stack (depth-first, in
+    document order) rather than one recursive call per level.
+    """
+    append = usages.append
+    read, workflow = UsageType.READ, SourceType.WORKFLOW
+    stack = [criteria]
+    
+    while stack:
+        criteria = stack.pop()
+        if type(criteria) is not dict:
+            continue
         
-        # Check if this is a group
+        # Check if this is a group; reversed so the first item pops first
         if 'group' in criteria:
-            for sub_criteria in criteria.get('group', []):
-                self._extract_criteria_reads(sub_criteria, module, source_label, source_id)
-            return
+            stack.extend(reversed(criteria['group']))
+            continue
         
         # Simple criteria - extract field reference
-        field_info = criteria.get('field', {})
-        if not field_info or not isinstance(field_info, dict):
-            return
-        
-        api_name = field_info.get('api_name', '')
+        api_name = _as_dict(criteria.get('field')).get('api_name', '')
         if not api_name:
-            return
-        
-        comparator = criteria.get('comparator', '')
-        value = criteria.get('value', '')
+            continue
+        api_name = intern(api_name)
         
-        self.tracker.add_usage(FieldUsage(
-            usage_type=UsageType.READ,
-            source_type=SourceType.WORKFLOW,
+        append(FieldUsage(
+            usage_type=read,
+            source_type=workflow,
             source_name=source_label,
             source_id=source_id,
             module=module,
             field_api_name=api_name,
             details={
-                'comparator': comparator,
-                'value': value,
+                'comparator': criteria.get('comparator', ''),
+                'value': criteria.get('value', ''),
             }
         ))
-        self.stats['criteria_reads'] += 1
+
+
+def _process_field_update_action(action: dict, module: str, source_label: str,
+                                 source_id: str, usages: List[FieldUsage]):
+    """Process a field update action."""
+    field_api_name = action.get('field_api_name', '')
+    field_value = action.get('field_value', '')
+    update_type = action.get('update_type', '')
+    action_name = action.get('name', '')
+    action_module = action.get('module', module)
+    if type(action_module) is dict:
+        action_module = action_module.get('api_name')
     
-    def _process_action(self, action: dict, module: str,
-                        source_label: str, source_id: str):
-        """Process a workflow action (field update, function call, etc.)."""
-        action_type = action.get('type', '')
-        
-        if action_type == 'field_updates':
-            self._process_field_update_action(action, module, source_label, source_id)
-        elif action_type == 'functions':
-            self.stats['function_refs'] += 1
-            # Function analysis handled by deluge analyzer
-    
-    def _process_field_update_action(self, action: dict, module: str,
-                                      source_label: str, source_id: str):
-        """Process a field update action."""
-        field_api_name = action.get('field_api_name', '')
-        field_value = action.get('field_value', '')
-        update_type = action.get('update_type', '')
-        action_name = action.get('name', '')
-        action_module = action.get('module', module)
-        
-        # Some field updates target related modules
-        related = action.get('related_details')
-        if related and isinstance(related, dict):
-            target_module = related.get('module', {}).get('api_name', action_module)
-        else:
-            target_module = action_module if action_module else module
-        
-        if not field_api_name:
-            logger.debug(f"No field_api_name in action {action_name}")
-            return
-        
-        self.tracker.add_usage(FieldUsage(
-            usage_type=UsageType.WRITE,
-            source_type=SourceType.WORKFLOW,
-            source_name=source_label,
-            source_id=source_id,
-            module=target_module,
-            field_api_name=field_api_name,
-            details={
-                'value': field_value,
-                'update_type': update_type,
-                'action_name': action_name,
-            }
-        ))
-        self.stats['field_writes'] += 1
+    # Some field updates target related modules
+    related = action.get('related_details')
+    if related and type(related) is dict:
+        target_module = _as_dict(related.get('module')).get('api_name', action_module)
+    else:
+        target_module = action_module if action_module else module
     
-    def get_function_references(self, workflows_dir: Path) -> List[dict]:
-        """Extract function names referenced by workflows."""
-        refs = []
-        
-        for wf_file in sorted(workflows_dir.glob("*.json")):
-            if wf_file.name in ('workflows_index.json', 'FAILED_EXTRACTIONS.txt'):
+    if not field_api_name:
+        logger.debug(f"No field_api_name in action {action_name}")
+        return
+    if not target_module or type(target_module) is not str:
+        logger.debug(f"No target module for action {action_name}: {target_module!r}")
+        return
+    field_api_name = intern(field_api_name)
+    target_module = intern(target_module)
+    
+    usages.append(FieldUsage(
+        usage_type=UsageType.WRITE,
+        source_type=SourceType.WORKFLOW,
+        source_name=source_label,
+        source_id=source_id,
+        module=target_module,
+        field_api_name=field_api_name,
+        details={
+            'value': field_value,
+            'update_type': update_type,
+            'action_name': action_name,
+        }
+    ))
+
+
+def _as_dict(value) -> dict:
+    """value if it is a dict, else an empty one (JSON nulls, lists, strings)."""
+    return value if type(value) is dict else {}
+
+
+def _intern_details(usages):
+    """
+    Intern the low-cardinality detail strings (comparators, update types).
+    
+    Done in the parent while recording: interning in a pool worker does
+    not survive pickling back. Module and field names are interned by
+    UsageTracker.add_usages.
+    """
+    for usage in usages:
+        details = usage.details
+        for key in _INTERNED_DETAILS:
+            if key in details:
+                details[key] = _intern(details[key])
+
+
+def _intern(value):
+    """sys.intern for strings; anything else (e.g. a null from JSON) as-is."""
+    return intern(value) if type(value) is str else value
+
+
+def _workflow_files(workflows_dir: Path) -> List[Path]:
+    """Workflow *.json files in name order, index and logs excluded."""
+    # scandir's DirEntry answers is_file() without another stat call; names
+    # are filtered and sorted before any Path is built
+    with os.scandir(workflows_dir) as it:
+        entries = sorted((e.name, e.path) for e in it
+                         if e.name.endswith('.json')
+                         and e.name not in _SKIP_FILES
+                         and e.is_file())
+    return [Path(path) for _, path in entries]
+
+
+def _load_workflow(wf_file: Path) -> dict:
+    """
+    Load the parts of a workflow file the analyzer uses.
+    
+    Files under STREAM_MIN_BYTES are parsed whole, with orjson when it
+    is installed (json otherwise): for them streaming costs more than
+    it saves. Larger files are streamed with ijson when it is installed,
+    and only the top-level keys in WORKFLOW_KEYS are built into Python
+    objects; everything else (descriptions, audit info, ...) is skipped
+    as it is parsed, so it never takes up memory.
+    """
+    if ijson is None or wf_file.stat().st_size < STREAM_MIN_BYTES:
+        if orjson is not None:
+            return orjson.loads(wf_file.read_bytes())
+        with open(wf_file) as f:
+            return json.load(f)
+    
+    wf = {}
+    key = None
+    builder = None
+    with open(wf_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if not prefix:
+                if event == 'map_key':
+                    key = value if value in WORKFLOW_KEYS else None
                 continue
-            
-            try:
-                with open(wf_file) as f:
-                    wf_data = json.load(f)
-                
-                wf_name = wf_data.get('name', '')
-                module = wf_data.get('module', {}).get('api_name', '')
-                
-                for condition in wf_data.get('conditions', []):
-                    for action_group in ('instant_actions', 'scheduled_actions'):
-                        actions_data = condition.get(action_group, {})
-                        if not isinstance(actions_data, dict):
-                            continue
-                        for action in actions_data.get('actions', []):
-                            if action.get('type') == 'functions':
-                                refs.append({
-                                    'function_name': action.get('name', ''),
-                                    'function_id': str(action.get('id', '')),
-                                    'workflow': wf_name,
-                                    'module': module,
-                                })
-            except Exception:
-                pass
-        
-        return refs
+            if key is None:
+                continue
+            if builder is None:
+                builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            # The value is complete once its own prefix sees a scalar or a close
+            if prefix == key and event not in ('start_map', 'start_array', 'map_key'):
+                wf[key] = builder.value
+                builder = None
+    return wf
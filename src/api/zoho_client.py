@@ -8,13 +8,22 @@ Credential loading from plain text files:
   config/{client_name}/org_id.txt
   config/{client_name}/static_token.txt (optional)
 """
+import hashlib
+import os
 import subprocess
 import json
+import threading
 import time
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+try:
+    import orjson  # optional: much faster response parsing
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,13 +38,41 @@ class CurlResponse:
       .headers (minimal -- curl doesn't capture response headers by default)
     """
     
-    def __init__(self, status_code: int, body: str):
+    def __init__(self, status_code: int, body: str, data: Any = None):
         self.status_code = status_code
         self.text = body
         self.headers = {}
+        # Body as already parsed by the client (None if it was not JSON)
+        self._data = data
     
     def json(self):
-        return json.loads(self.text)
+        if self._data is not None:
+            return self._data
+        return _loads(self.text)
+
+
+class RateLimiter:
+    """
+    Spaces out request starts: at most one per `interval` seconds.
+    
+    Thread-safe, so worker threads sharing one limiter issue requests no
+    faster than a serial loop sleeping `interval` between calls would,
+    while each request's own latency overlaps with the others.
+    """
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+    
+    def wait(self):
+        """Block until the caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
 
 
 class ZohoAPIClient:
@@ -49,7 +86,21 @@ class ZohoAPIClient:
     def __init__(self, cookie: str, csrf_token: str, org_id: str, 
                  static_token: Optional[str] = None,
                  all_headers: Optional[Dict[str, str]] = None,
-                 max_retries: int = 3, retry_delay: float = 1.0):
+                 max_retries: int = 3, retry_delay: float = 1.0,
+                 cache_dir: Optional[Path] = None,
+                 cache_ttl: float = 24 * 3600):
+        """
+        Args:
+            cookie, csrf_token, org_id, static_token: Session credentials
+            all_headers: Full browser headers (from headers.json)
+            max_retries: Attempts per request on 429/5xx
+            retry_delay: Base backoff delay in seconds (doubled per attempt)
+            cache_dir: Cache successful GET bodies here and serve repeats
+                       from disk (default: $ZOHO_CACHE_DIR; unset = off).
+                       Meant for analyzer development, where the same
+                       pages are fetched run after run.
+            cache_ttl: Seconds a cached body stays valid
+        """
         self.csrf_token = csrf_token.strip()
         self.org_id = org_id.strip()
         self.static_token = static_token.strip() if static_token else None
@@ -59,6 +110,14 @@ class ZohoAPIClient:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         
+        if cache_dir is None and os.environ.get('ZOHO_CACHE_DIR'):
+            cache_dir = Path(os.environ['ZOHO_CACHE_DIR'])
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Caching GET responses in {self.cache_dir} (ttl {cache_ttl:.0f}s)")
+        
         # Use all original headers if provided (from headers.json)
         # Otherwise fall back to minimal set
         if all_headers:
@@ -166,15 +225,16 @@ class ZohoAPIClient:
                 logger.error("curl returned empty output")
                 if result.stderr:
                     logger.error(f"stderr: {result.stderr[:300]}")
-                return 0, ''
+                return 0, '', None
             
             body = output.strip()
             
             # Infer status from response content
             # Zoho returns JSON with "code" field on errors
             status = 200  # assume success
+            j = None
             try:
-                j = json.loads(body)
+                j = _loads(body)
                 code = j.get('code', '')
                 if code == 'AUTHENTICATION_FAILURE':
                     status = 401
@@ -189,14 +249,15 @@ class ZohoAPIClient:
                 if '<html' in body.lower()[:200]:
                     status = 401
             
-            return status, body
+            # Parsed once here; CurlResponse.json() hands it back
+            return status, body, j
             
         except subprocess.TimeoutExpired:
             logger.error("curl timed out after 30s")
-            return 0, ''
+            return 0, '', None
         except Exception as e:
             logger.error(f"curl execution failed: {e}")
-            return 0, ''
+            return 0, '', None
         finally:
             try:
                 Path(ps1_path).unlink(missing_ok=True)
@@ -216,60 +277,87 @@ class ZohoAPIClient:
         else:
             full_url = url
         
-        for attempt in range(self.max_retries):
-            cmd = self._build_curl_cmd(full_url, headers)
-            
-            logger.debug(f"GET {full_url}")
-            status, body = self._exec_curl(cmd)
-            logger.debug(f"Status: {status}")
-            
-            if status == 200:
-                return CurlResponse(status, body)
-            elif status == 429:
-                wait = self.retry_delay * (2 ** attempt)
-                logger.warning(f"Rate limited (429). Waiting {wait}s...")
-                time.sleep(wait)
-            elif status >= 500:
-                wait = self.retry_delay * (2 ** attempt)
-                logger.warning(f"Server error ({status}). Waiting {wait}s...")
-                time.sleep(wait)
-            else:
-                logger.error(f"Request failed: {status}")
-                return CurlResponse(status, body)
+        cache_file = self._cache_file(url, params, headers) if self.cache_dir else None
+        if cache_file is not None:
+            body = self._read_cache(cache_file)
+            if body is not None:
+                logger.debug(f"GET {full_url} (cached)")
+                return CurlResponse(200, body)
         
-        raise Exception(f"Failed after {self.max_retries} retries")
+        cmd = self._build_curl_cmd(full_url, headers)
+        response = self._send(cmd, f"GET {full_url}")
+        
+        # Status 200 is only inferred (no recognised error code), so cache
+        # nothing but bodies that actually parsed as JSON
+        if (cache_file is not None and response.status_code == 200
+                and isinstance(response._data, (dict, list))):
+            self._write_cache(cache_file, response.text)
+        return response
+    
+    def _cache_file(self, url: str, params: Optional[Dict[str, Any]],
+                    headers: Optional[Dict[str, str]]) -> Path:
+        """Cache path for a GET, keyed by a hash of org, url, params and extra headers."""
+        key = repr((self.org_id, url, sorted((params or {}).items()),
+                    sorted((headers or {}).items())))
+        return self.cache_dir / f"{hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()}.json"
+    
+    def _read_cache(self, cache_file: Path) -> Optional[str]:
+        """Cached body, or None if missing or older than cache_ttl."""
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            return cache_file.read_text(encoding='utf-8')
+        except OSError:
+            return None
+    
+    def _write_cache(self, cache_file: Path, body: str):
+        """Write a body atomically, so a crash never leaves half a file."""
+        tmp = cache_file.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            tmp.write_text(body, encoding='utf-8')
+            os.replace(tmp, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write response cache {cache_file}: {e}")
     
     def post(self, url: str, data: Optional[Dict[str, Any]] = None,
              json_data: Optional[Dict[str, Any]] = None,
              headers: Optional[Dict[str, str]] = None, **kwargs) -> CurlResponse:
         """Make POST request with retry logic."""
+        cmd = self._build_curl_cmd(url, headers)
+        cmd.extend(['-X', 'POST'])
+        
+        if json_data:
+            cmd.extend(['-H', 'Content-Type: application/json'])
+            cmd.extend(['-d', json.dumps(json_data)])
+        elif data:
+            for k, v in data.items():
+                cmd.extend(['--data-urlencode', f'{k}={v}'])
+        
+        return self._send(cmd, f"POST {url}")
+    
+    def _send(self, cmd: list, label: str) -> CurlResponse:
+        """
+        Run a curl command, retrying rate limits (429) and server errors
+        (5xx) with exponential backoff. Shared by get() and post().
+        """
         for attempt in range(self.max_retries):
-            cmd = self._build_curl_cmd(url, headers)
-            cmd.extend(['-X', 'POST'])
-            
-            if json_data:
-                cmd.extend(['-H', 'Content-Type: application/json'])
-                cmd.extend(['-d', json.dumps(json_data)])
-            elif data:
-                for k, v in data.items():
-                    cmd.extend(['--data-urlencode', f'{k}={v}'])
-            
-            logger.debug(f"POST {url}")
-            status, body = self._exec_curl(cmd)
+            logger.debug(label)
+            status, body, data = self._exec_curl(cmd)
+            logger.debug(f"Status: {status}")
             
             if status == 200:
-                return CurlResponse(status, body)
+                return CurlResponse(status, body, data)
             elif status == 429:
                 wait = self.retry_delay * (2 ** attempt)
-                logger.warning(f"Rate limited. Waiting {wait}s...")
+                logger.warning(f"Rate limited (429). Waiting {wait}s...")
                 time.sleep(wait)
             elif status >= 500:
                 wait = self.retry_delay * (2 ** attempt)
-                logger.warning(f"Server error. Waiting {wait}s...")
+                logger.warning(f"Server error ({status}). Waiting {wait}s...")
                 time.sleep(wait)
             else:
                 logger.error(f"Request failed: {status}")
-                return CurlResponse(status, body)
+                return CurlResponse(status, body, data)
         
         raise Exception(f"Failed after {self.max_retries} retries")
     
@@ -387,7 +475,8 @@ def load_credentials(client_name: str, config_dir: Path = None) -> Dict[str, str
 def create_client_from_credentials(client_name: str, 
                                     config_dir: Path = None,
                                     max_retries: int = 3,
-                                    retry_delay: float = 1.0) -> ZohoAPIClient:
+                                    retry_delay: float = 1.0,
+                                    cache_dir: Optional[Path] = None) -> ZohoAPIClient:
     """Create a ZohoAPIClient by loading credentials for a client."""
     creds = load_credentials(client_name, config_dir)
     
@@ -399,4 +488,5 @@ def create_client_from_credentials(client_name: str,
         all_headers=creds.get('all_headers'),
         max_retries=max_retries,
         retry_delay=retry_delay,
+        cache_dir=cache_dir,
     )
@@ -7,18 +7,25 @@ Fixed to work with actual ZohoAPIClient interface:
 - Implements offset-based pagination (start/limit) matching Zoho's functions API
 - Parses Response objects correctly
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List
 import logging
 import time
 
 from .base import BaseExtractor
-from ..api.zoho_client import ZohoAPIClient
+from ..api.zoho_client import ZohoAPIClient, RateLimiter
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = 'https://crm.zoho.com/crm/v2'
 
+# Function sources are downloaded by this many threads; request starts
+# stay at least SOURCE_REQUEST_INTERVAL seconds apart, as in the old
+# serial loop, but the requests' own latency overlaps
+SOURCE_DOWNLOAD_WORKERS = 4
+SOURCE_REQUEST_INTERVAL = 0.5
+
 
 class FunctionsExtractor(BaseExtractor):
     """Extract Deluge functions from Zoho CRM"""
@@ -129,6 +136,61 @@ class FunctionsExtractor(BaseExtractor):
             return func_detail.get('script', '')
         return ''
     
+    def _save_function(self, i: int, total: int, func: Dict[str, Any],
+                       source_data: Dict[str, Any], all_functions_data: list,
+                       failed_items: list):
+        """Save one downloaded function source and record the outcome."""
+        func_id = func['id']
+        func_name = func.get('display_name', f'function_{func_id}')
+        
+        logger.info(f"[{i}/{total}] Extracting: {func_name}")
+        
+        try:
+            script = self.extract_script_from_response(source_data)
+            
+            if script:
+                # Create metadata header
+                header = self.create_metadata_header(
+                    func,
+                    id_field='id',
+                    name_field='display_name'
+                )
+                
+                full_content = header + script
+                
+                # Save to individual file
+                filename = f"{self.sanitize_filename(func_name)}_{func_id}.txt"
+                self.save_text(full_content, f"functions/{filename}")
+                
+                all_functions_data.append({
+                    'metadata': func,
+                    'script': script,
+                    'filename': filename
+                })
+                
+                self.stats['successful'] += 1
+                logger.info(f"  [OK] Saved")
+                
+            else:
+                reason = "No script in response"
+                logger.warning(f"  [FAIL] {reason}")
+                failed_items.append({
+                    'name': func_name,
+                    'id': func_id,
+                    'reason': reason
+                })
+                self.stats['failed'] += 1
+                
+        except Exception as e:
+            reason = str(e)
+            logger.error(f"  [FAIL] {reason}")
+            failed_items.append({
+                'name': func_name,
+                'id': func_id,
+                'reason': reason
+            })
+            self.stats['failed'] += 1
+    
     def extract(self) -> Dict[str, Any]:
         """Extract all Deluge functions and save to files"""
         
@@ -147,61 +209,18 @@ class FunctionsExtractor(BaseExtractor):
         failed_items = []
         all_functions_data = []
         
-        for i, func in enumerate(functions, 1):
-            func_id = func['id']
-            func_name = func.get('display_name', f'function_{func_id}')
-            
-            logger.info(f"[{i}/{len(functions)}] Extracting: {func_name}")
-            
-            try:
-                source_data = self.get_function_source(func_id)
-                script = self.extract_script_from_response(source_data)
-                
-                if script:
-                    # Create metadata header
-                    header = self.create_metadata_header(
-                        func,
-                        id_field='id',
-                        name_field='display_name'
-                    )
-                    
-                    full_content = header + script
-                    
-                    # Save to individual file
-                    filename = f"{self.sanitize_filename(func_name)}_{func_id}.txt"
-                    self.save_text(full_content, f"functions/{filename}")
-                    
-                    all_functions_data.append({
-                        'metadata': func,
-                        'script': script,
-                        'filename': filename
-                    })
-                    
-                    self.stats['successful'] += 1
-                    logger.info(f"  [OK] Saved")
-                    
-                else:
-                    reason = "No script in response"
-                    logger.warning(f"  [FAIL] {reason}")
-                    failed_items.append({
-                        'name': func_name,
-                        'id': func_id,
-                        'reason': reason
-                    })
-                    self.stats['failed'] += 1
-                    
-            except Exception as e:
-                reason = str(e)
-                logger.error(f"  [FAIL] {reason}")
-                failed_items.append({
-                    'name': func_name,
-                    'id': func_id,
-                    'reason': reason
-                })
-                self.stats['failed'] += 1
-            
-            # Rate limiting
-            time.sleep(0.5)
+        limiter = RateLimiter(SOURCE_REQUEST_INTERVAL)
+        
+        def fetch_source(func):
+            limiter.wait()
+            return self.get_function_source(func['id'])
+        
+        with ThreadPoolExecutor(max_workers=SOURCE_DOWNLOAD_WORKERS) as executor:
+            # Results come back in list order; downloads run ahead of saving
+            sources = executor.map(fetch_source, functions)
+            for i, (func, source_data) in enumerate(zip(functions, sources), 1):
+                self._save_function(i, len(functions), func, source_data,
+                                    all_functions_data, failed_items)
         
         # Save master index
         self.save_json(all_functions_data, 'functions_index.json')
@@ -8,6 +8,11 @@ import yaml
 from typing import Dict, Any, Optional
 import logging
 
+try:
+    import orjson  # optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +52,8 @@ def load_json(filepath: Path) -> Any:
     Returns:
         Loaded data
     """
+    if orjson is not None:
+        return orjson.loads(Path(filepath).read_bytes())
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -58,8 +65,13 @@ def save_json(data: Any, filepath: Path, indent: int = 2) -> None:
     Args:
         data: Data to save
         filepath: Path to save to
-        indent: JSON indentation
+        indent: JSON indentation (orjson is used only for the default of 2,
+            the one indent it supports)
     """
+    if orjson is not None and indent == 2:
+        Path(filepath).write_bytes(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(data, f, indent=indent, ensure_ascii=False)
 